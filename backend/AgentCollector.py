@@ -1,16 +1,35 @@
-import feedparser
-import requests
 from newspaper import Article
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import re
 from urllib.parse import urlparse, urljoin
-import time
 import json
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
 import random
+import heapq
+import io
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from rate_limiter import HostRateLimiter, RateLimitConfig
+from http_cache import HTTPCache
+from html_cache import HTMLCache, get_default_html_cache
+from circuit_breaker import HostCircuitBreaker, CircuitOpenError
+from collection_budget import CollectionBudget, BudgetExhausted
+from http_cassette import load_cassette_from_env
+from request_coalescer import SingleFlight
+from sitemap_parser import iter_sitemap, SitemapEntry, SitemapParseError
+from url_ledger import URLLedger
+from feed_parsing import parse_feed_entries
+from homepage_discovery import HomepageDiscovery
+from url_utils import canonicalize_url, dedup_key, slug_tokens
+from near_duplicates import NearDuplicateIndex, drop_near_duplicates, simhash
+from keyword_taxonomy import load_taxonomy
+from batch_scoring import score_batch
+from bm25 import BM25Scorer, CorpusStats, DEFAULT_RELEVANCE_MODEL, RELEVANCE_MODELS
+from semantic_relevance import SemanticRelevance, SEMANTIC_ENABLED
 
 # Import extract_author from AgentSumm
 try:
@@ -21,20 +40,12 @@ except ImportError:
     print("⚠️  Warning: Could not import extract_author from AgentSumm")
     print("   Author extraction will use fallback method")
 
-# Try to import curl-cffi (most powerful anti-blocking)
-try:
-    from curl_cffi import requests as curl_requests
-    CURL_CFFI_AVAILABLE = True
-except ImportError:
-    CURL_CFFI_AVAILABLE = False
-    print("Note: Install curl-cffi for best anti-blocking: pip install curl-cffi")
+# Anti-blocking clients (curl-cffi, then cloudscraper, then requests) come from the shared pool
+from client_pool import get_default_client_pool, CURL_CFFI_AVAILABLE, CLOUDSCRAPER_AVAILABLE
 
-# Try to import cloudscraper (fallback)
-try:
-    import cloudscraper
-    CLOUDSCRAPER_AVAILABLE = True
-except ImportError:
-    CLOUDSCRAPER_AVAILABLE = False
+if not CURL_CFFI_AVAILABLE:
+    print("Note: Install curl-cffi for best anti-blocking: pip install curl-cffi")
+if not CLOUDSCRAPER_AVAILABLE:
     print("Note: Install cloudscraper for better anti-blocking: pip install cloudscraper")
 
 @dataclass
@@ -42,37 +53,49 @@ class ArticleCandidate:
     title: str
     url: str
     publication: str
-    published_date: datetime
+    published_date: Optional[datetime]  # None until known (homepage links carry no date)
     summary: str
     author: str = "Unknown"
     relevance_score: float = 0.0
     keywords_found: List[str] = None
     full_content: str = ""
+    semantic_score: float = None
+
+class _ThreadBufferedStdout:
+    """Route print() output from collector worker threads into per-thread buffers"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def begin(self):
+        self._local.buffer = io.StringIO()
+
+    def end(self) -> str:
+        buffer = getattr(self._local, 'buffer', None)
+        self._local.buffer = None
+        return buffer.getvalue() if buffer else ""
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
 
 class CustomArticleCollector:
     def __init__(self):
         """Initialize collector with your specific sources and keywords"""
         
-        # Your custom keywords for relevance filtering (British English)
-        self.luxury_keywords = [
-            'luxury', 'jewellery', 'fine jewellery', 'craftsmanship',
-            'jewelry', 'diamond', 'engagement ring', 'wedding ring',
-            'fashion', 'accessories', 'watches', 'timepiece',
-            'necklace', 'bracelet', 'earrings', 'pendant', 'brooch',
-            'gold', 'platinum', 'silver', 'emerald', 'sapphire', 'ruby',
-            'cartier', 'tiffany', 'bulgari', 'chanel', 'dior', 'van cleef',
-            'graff', 'harry winston', 'chopard', 'piaget', 'boucheron',
-            'red carpet', 'celebrity', 'haute couture', 'collection',
-            'launch', 'collaboration', 'limited edition', 'auction',
-            'investment', 'trends', 'style', 'fashion week', 'royal', 'royals',
-            'Luxury sector', 'Luxury marketing trends', 'Lab grown diamonds',
-            'Diamond price', 'Gold price', 'jewels',
-            # English royalty keywords
-            'crown', 'tiara', 'coronation', 'queen', 'king', 'prince', 'princess',
-            'duchess', 'duke', 'royal family', 'buckingham palace', 'windsor',
-            'crown jewels', 'state visit', 'royal wedding', 'monarchy',
-            'sovereign', 'regalia', 'royal collection', 'palace'
-        ]
+        # Your custom keywords for relevance filtering (British English), with their
+        # category weights, come from the versioned taxonomy file (keywords.json)
+        self.taxonomy = load_taxonomy()
+        self.luxury_keywords = self.taxonomy.keywords
         
         # Your specific publication sources - MULTIPLE RSS FEEDS SUPPORTED
         self.target_sources = {
@@ -89,7 +112,8 @@ class CustomArticleCollector:
                 'rss_feeds': [
                     'https://www.telegraph.co.uk/luxury/rss'
                 ],
-                'sitemap_url': 'https://www.telegraph.co.uk/luxury/sitemap.xml'
+                'sitemap_url': 'https://www.telegraph.co.uk/luxury/sitemap.xml',
+                'rate_limit': {'rate': 0.2, 'burst': 1}
             },
             'Evening Standard': {
                 'base_url': 'https://www.standard.co.uk/topic/jewellery',
@@ -256,25 +280,15 @@ class CustomArticleCollector:
             }
         }
         
-        # Initialize scraper with priority order
-        if CURL_CFFI_AVAILABLE:
-            self.scraper = curl_requests.Session()
-            self.scraper_type = 'curl-cffi'
+        # Shared client pool: keep-alive sessions per host, reused across entry points
+        self.client_pool = get_default_client_pool()
+        self.scraper_type = self.client_pool.scraper_type
+        if self.scraper_type == 'curl-cffi':
             print("✅ curl-cffi enabled (most powerful anti-blocking)")
             print("   Can bypass CloudFlare, SSL checks, and bot detection\n")
-        elif CLOUDSCRAPER_AVAILABLE:
-            self.scraper = cloudscraper.create_scraper(
-                browser={
-                    'browser': 'chrome',
-                    'platform': 'windows',
-                    'mobile': False
-                }
-            )
-            self.scraper_type = 'cloudscraper'
+        elif self.scraper_type == 'cloudscraper':
             print("✅ CloudScraper enabled for anti-blocking\n")
         else:
-            self.scraper = requests.Session()
-            self.scraper_type = 'requests'
             print("⚠️  Using basic requests (limited anti-blocking)\n")
         
         # User-Agent rotation
@@ -288,40 +302,137 @@ class CustomArticleCollector:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 OPR/107.0.0.0'
         ]
         
-        # Rate limiting
-        self.request_count = 0
-        self.last_request_time = time.time()
-        self.min_delay_between_requests = 2.0
-        self.max_delay_between_requests = 5.0
-        self.requests_per_source = 0
-        self.max_requests_per_minute = 20
+        # Rate limiting: one token bucket per host, overridable per source via 'rate_limit'
+        self.rate_limiter = HostRateLimiter(RateLimitConfig(rate=0.4, burst=2, jitter=1.0))
+        self._configure_source_rate_limits()
+        
+        # Circuit breaker: hosts that keep blocking us (403/429/SSL) are skipped with backoff
+        self.circuit_breaker = HostCircuitBreaker(failure_threshold=3)
+        
+        # Optional record/replay cassette (COLLECTOR_CASSETTE=record:<path> or replay:<path>)
+        self.cassette = load_cassette_from_env()
+        if self.cassette is not None:
+            print(f"📼 HTTP cassette: {self.cassette.mode} {self.cassette.path}\n")
+        
+        if self.cassette is not None and self.cassette.replaying:
+            # Replayed (possibly old) responses must not reach the live caches, where the
+            # next live run would pair them with current validators and reuse them on a 304
+            replay_cache_dir = tempfile.mkdtemp(prefix='collector-replay-')
+            self.http_cache = HTTPCache(replay_cache_dir)
+            self.html_cache = HTMLCache(replay_cache_dir)
+        else:
+            # Conditional-GET cache for sitemaps and RSS feeds (persists between runs)
+            self.http_cache = HTTPCache()
+            
+            # Article pages are cached by content hash and shared with Relvance.py and AgentSumm
+            self.html_cache = get_default_html_cache()
+        
+        # Only the best-ranked recent URLs of a sitemap are considered (recency + keywords),
+        # and only the most recent children of a sitemap index are crawled
+        self.sitemap_max_urls = 50
+        self.sitemap_max_children = 8
+        
+        # Feeds and sitemaps are fetched (and parsed) once per run, even when several
+        # code paths or sources ask for the same URL
+        self.request_memo = SingleFlight("Request coalescing")
+        self.parsed_memo = SingleFlight("Parsed feed/sitemap reuse")
+        
+        # Run-wide dedup: canonical article key -> the one (publication, URL) allowed to fetch it
+        self._claimed_urls: Dict[str, Tuple[str, str]] = {}
+        self._claimed_lock = threading.Lock()
+        self.duplicates_skipped = 0
+        
+        # Near-duplicate text (syndicated/wire copy under different URLs): SimHash + LSH bands
+        self.near_duplicates = NearDuplicateIndex(max_distance=8)
+        self._fingerprinted: Dict[Tuple[str, str], ArticleCandidate] = {}
+        
+        # Homepage/section link discovery (third tier); XPath selectors compiled once per publication
+        self.homepage_discovery = HomepageDiscovery()
+        
+        # Relevance model for this run (RELEVANCE_MODEL=keywords|bm25). Keyword document
+        # frequencies are gathered from fetched articles whichever model is used
+        self.relevance_model = DEFAULT_RELEVANCE_MODEL
+        if self.relevance_model not in RELEVANCE_MODELS:
+            raise ValueError(f"Unknown RELEVANCE_MODEL {self.relevance_model!r} (use one of {RELEVANCE_MODELS})")
+        self.corpus_stats = CorpusStats(read_only=self.cassette is not None)
+        self.bm25 = BM25Scorer(self.taxonomy, self.corpus_stats) if self.relevance_model == 'bm25' else None
+        
+        # Optional semantic filter between discovery and extraction (SEMANTIC_RELEVANCE=1).
+        # When on, a run discovers every publication first so all candidates are embedded in one batch
+        self.semantic = None
+        if SEMANTIC_ENABLED:
+            try:
+                self.semantic = SemanticRelevance(self.taxonomy.topics)
+            except (ImportError, ValueError) as e:
+                print(f"⚠️  Semantic relevance disabled: {e}")
+        self.scoring_key = f"{self.relevance_model}:{self.taxonomy.cache_key}"
+        if self.semantic is not None:
+            self.scoring_key += f"+semantic:{self.semantic.model_name}@{self.semantic.threshold}"
+        
+        # Outcomes of earlier runs: rejected/blocked articles are not fetched again for a while
+        # (disabled with a cassette, so recorded runs replay the same requests)
+        self.url_ledger = URLLedger(scoring_key=self.scoring_key) if self.cassette is None else None
+        
+        # Optional run budget (set by the pipeline runner); None means unlimited
+        self.budget: Optional[CollectionBudget] = None
+        
+        # Concurrency: publications are crawled in parallel worker threads
+        self.max_workers = 8
     
     def get_random_user_agent(self):
         return random.choice(self.user_agents)
     
-    def apply_rate_limit(self):
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _configure_source_rate_limits(self):
+        """Apply per-source 'rate_limit' overrides to every host the source uses"""
+        for source_info in self.target_sources.values():
+            overrides = source_info.get('rate_limit')
+            if not overrides:
+                continue
+            
+            config = RateLimitConfig(**{**vars(self.rate_limiter.default_config), **overrides})
+            source_urls = [source_info.get('base_url'), source_info.get('sitemap_url')]
+            source_urls.extend(source_info.get('rss_feeds', []))
+            for url in source_urls:
+                if url:
+                    self.rate_limiter.configure_host(url, config)
+    
+    def apply_rate_limit(self, url: str):
+        """Wait for the token bucket of url's host; other hosts are unaffected"""
+        self.rate_limiter.acquire(url)
+    
+    def make_request(self, url: str, timeout: int = 10, headers: Dict[str, str] = None, conditional: bool = False):
+        """
+        Make HTTP request with curl-cffi for better anti-blocking
         
-        if time_since_last < self.min_delay_between_requests:
-            sleep_time = self.min_delay_between_requests - time_since_last
-            time.sleep(sleep_time)
+        With conditional=True the request carries cached ETag/Last-Modified validators,
+        and a 304 is answered with the cached body (response.not_modified is True).
+        Raises CircuitOpenError without touching the network if the host keeps blocking us,
+        and BudgetExhausted once the run's (or this source's) budget is spent.
+        In cassette replay mode the recorded response is returned with no delay.
+        Conditional requests (feeds and sitemaps) are coalesced: each URL is requested
+        at most once per run and the response is shared by every caller.
+        """
+        if conditional:
+            return self.request_memo.do(url, lambda: self._make_request(url, timeout, headers, conditional))
+        return self._make_request(url, timeout, headers, conditional)
+    
+    def _make_request(self, url: str, timeout: int, headers: Optional[Dict[str, str]], conditional: bool):
+        if self.cassette is not None and self.cassette.replaying:
+            return self.cassette.replay(url)
         
-        random_delay = random.uniform(0, self.max_delay_between_requests - self.min_delay_between_requests)
-        time.sleep(random_delay)
+        if not self.circuit_breaker.allow(url):
+            raise CircuitOpenError(f"Circuit open for {urlparse(url).netloc} - skipping request")
         
-        self.last_request_time = time.time()
-        self.request_count += 1
+        if self.budget is not None:
+            try:
+                self.budget.charge()
+            except BudgetExhausted:
+                self.circuit_breaker.end_trial(url)
+                raise
         
-        if self.request_count % self.max_requests_per_minute == 0:
-            print(f"  Rate limit: Processed {self.request_count} requests, brief pause...")
-            time.sleep(random.uniform(5, 10))
-    
-    def make_request(self, url: str, timeout: int = 10):
-        """Make HTTP request with curl-cffi for better anti-blocking"""
-        self.apply_rate_limit()
+        self.apply_rate_limit(url)
         
-        headers = {
+        request_headers = {
             'User-Agent': self.get_random_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -334,18 +445,17 @@ class CustomArticleCollector:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0'
         }
+        if headers:
+            request_headers.update(headers)
+        if conditional:
+            request_headers.update(self.http_cache.conditional_headers(url))
         
         try:
-            if self.scraper_type == 'curl-cffi':
-                response = self.scraper.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout,
-                    impersonate="chrome110",
-                    verify=True
-                )
-            else:
-                response = self.scraper.get(url, headers=headers, timeout=timeout)
+            response = self.client_pool.get(url, headers=request_headers, timeout=timeout)
+            self._record_circuit_outcome(url, response.status_code)
+            
+            if conditional:
+                response = self._apply_http_cache(url, response)
             
             if response.status_code != 200:
                 domain = urlparse(url).netloc
@@ -354,10 +464,14 @@ class CustomArticleCollector:
                 else:
                     print(f"    HTTP {response.status_code} error for {url}")
             
+            if self.cassette is not None:
+                self.cassette.record(url, response)
             return response
             
         except Exception as e:
             error_msg = str(e)
+            # Timeouts, resets and DNS failures count too; this also ends a half-open trial
+            self._record_circuit_failure(url)
             
             if 'SSL' in error_msg or 'ssl' in error_msg.lower():
                 print(f"    SSL Error: {urlparse(url).netloc} is blocking with SSL handshake")
@@ -365,19 +479,52 @@ class CustomArticleCollector:
                 if self.scraper_type == 'curl-cffi':
                     try:
                         print(f"    Retrying without SSL verification...")
-                        response = self.scraper.get(
-                            url,
-                            headers=headers,
-                            timeout=timeout,
-                            impersonate="chrome110",
-                            verify=False
-                        )
+                        response = self.client_pool.get(url, headers=request_headers, timeout=timeout, verify=False)
+                        self._record_circuit_outcome(url, response.status_code)
+                        if conditional:
+                            response = self._apply_http_cache(url, response)
+                        if self.cassette is not None:
+                            self.cassette.record(url, response)
                         return response
                     except:
                         pass
             
             print(f"    Request error: {error_msg[:100]}")
             raise
+    
+    def _record_circuit_outcome(self, url: str, status_code: int):
+        """403/429 count towards opening the host's circuit; anything else resets it"""
+        if status_code in (403, 429):
+            self._record_circuit_failure(url)
+        else:
+            self.circuit_breaker.record_success(url)
+    
+    def _record_circuit_failure(self, url: str):
+        if self.circuit_breaker.record_failure(url):
+            print(f"    Circuit opened for {urlparse(url).netloc} after repeated blocking "
+                  f"(backing off {self.circuit_breaker.cooldown_for(url):.0f}s)")
+    
+    def fetch_article(self, url: str, timeout: int = 20):
+        """Fetch an article page, serving it from the shared HTML cache when we already have it"""
+        # With a cassette every page must pass through make_request to be recorded/replayed
+        cached = self.html_cache.get_response(url) if self.cassette is None else None
+        if cached is not None:
+            return cached
+        
+        response = self.make_request(url, timeout=timeout)
+        if response.status_code == 200:
+            self.html_cache.put(url, response.text)
+        return response
+    
+    def _apply_http_cache(self, url: str, response):
+        """Serve 304s from the conditional-GET cache and store fresh 200s"""
+        if response.status_code == 304:
+            cached = self.http_cache.load(url)
+            if cached is not None:
+                return cached
+        elif response.status_code == 200:
+            self.http_cache.store(url, response)
+        return response
 
     def _fallback_extract_author(self, article, text: str) -> str:
         """Fallback author extraction if AgentSumm is not available"""
@@ -398,53 +545,21 @@ class CustomArticleCollector:
 
     def calculate_relevance_score(self, title: str, content: str) -> tuple:
         """Calculate relevance score based on your custom keywords"""
-        combined_text = f"{title} {content}".lower()
-        found_keywords = []
-        score = 0.0
-        
-        for keyword in self.luxury_keywords:
-            if keyword.lower() in combined_text:
-                found_keywords.append(keyword)
-                
-                # Core priority keywords
-                if keyword.lower() in ['luxury', 'jewellery', 'fine jewellery', 'craftsmanship', 'jewels']:
-                    score += 4.0
-                # Primary jewelry terms + royalty keywords
-                elif keyword.lower() in ['jewelry', 'diamond', 'engagement ring', 'wedding ring', 'Lab grown diamonds',
-                                         'Diamond price', 'Gold price', 'crown', 'tiara', 'coronation', 'queen', 
-                                         'king', 'prince', 'princess', 'duchess', 'duke', 'royal family', 
-                                         'buckingham palace', 'windsor', 'crown jewels', 'state visit', 
-                                         'royal wedding', 'monarchy', 'sovereign', 'regalia', 'royal collection', 'palace']:
-                    score += 3.0
-                # Jewelry pieces and materials
-                elif keyword.lower() in ['necklace', 'bracelet', 'earrings', 'pendant', 'brooch',
-                                         'gold', 'platinum', 'silver', 'emerald', 'sapphire', 'ruby']:
-                    score += 2.5
-                # Premium luxury brands
-                elif keyword.lower() in ['cartier', 'tiffany', 'bulgari', 'chanel', 'dior', 'van cleef',
-                                         'graff', 'harry winston', 'chopard', 'piaget', 'boucheron']:
-                    score += 3.5
-                # Fashion and luxury terms
-                elif keyword.lower() in ['fashion', 'accessories', 'watches', 'timepiece', 'collection', 
-                                         'launch', 'haute couture', 'limited edition']:
-                    score += 2.5
-                # Events and celebrity
-                elif keyword.lower() in ['red carpet', 'celebrity', 'fashion week', 'auction', 'royal', 'royals']:
-                    score += 2.0
-                # Industry terms
-                elif keyword.lower() in ['collaboration', 'investment', 'trends', 'style', 'Luxury sector', 
-                                         'Luxury marketing trends']:
-                    score += 1.5
-                else:
-                    score += 1.0
-        
-        # Bonus for multiple keyword matches
-        if len(found_keywords) > 2:
-            score *= 1.2
-        if len(found_keywords) > 4:
-            score *= 1.4
-            
-        return score, found_keywords
+        if self.bm25 is not None:
+            return self.bm25.score(f"{title} {content}")
+        return self.taxonomy.score(f"{title} {content}")
+    
+    def score_batch(self, candidates: List[ArticleCandidate]) -> List[ArticleCandidate]:
+        """Score candidates together (title + full content, or summary), in place"""
+        texts = [f"{c.title} {c.full_content or c.summary}" for c in candidates]
+        if self.bm25 is not None:
+            results = [self.bm25.score(text) for text in texts]
+        else:
+            results = score_batch(self.taxonomy, texts)
+        for candidate, (score, keywords) in zip(candidates, results):
+            candidate.relevance_score = score
+            candidate.keywords_found = keywords
+        return candidates
     
     def try_rss_feed(self, publication: str, feed_url: str) -> List[ArticleCandidate]:
         """Try to fetch articles from a single RSS feed"""
@@ -454,34 +569,16 @@ class CustomArticleCollector:
             return candidates
             
         try:
-            is_premium = any(domain in feed_url for domain in ['downjones.io', 'wsj.com', 'nytimes.com'])
+            # Parsed once per run, however many times (or by however many sources) it is asked for
+            entries = self.parsed_memo.do(('feed', feed_url), lambda: self._fetch_feed_entries(feed_url))
             
-            if is_premium and self.scraper_type == 'curl-cffi':
-                response = self.scraper.get(
-                    feed_url,
-                    timeout=15,
-                    impersonate="chrome110",
-                    headers={
-                        'User-Agent': self.get_random_user_agent(),
-                        'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                    }
-                )
-            else:
-                response = self.make_request(feed_url, timeout=10)
-            
-            if response.status_code != 200:
+            if not entries:
                 return candidates
             
-            feed = feedparser.parse(response.content)
-            
-            if not hasattr(feed, 'entries') or len(feed.entries) == 0:
-                return candidates
-            
-            for entry in feed.entries[:20]:
+            for entry in entries[:20]:
                 try:
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6])
+                    if entry['published']:
+                        pub_date = datetime.fromisoformat(entry['published'])
                     else:
                         pub_date = datetime.now()
                     
@@ -489,35 +586,60 @@ class CustomArticleCollector:
                     if (datetime.now() - pub_date).days > 7:
                         continue
                     
-                    title = entry.get('title', '').strip()
-                    summary = entry.get('summary', '').strip()
-                    url = entry.get('link', '').strip()
+                    title = entry['title']
+                    summary = entry['summary']
+                    url = entry['link']
                     
                     if not title or not url:
                         continue
                     
-                    score, keywords = self.calculate_relevance_score(title, summary)
-                    
-                    if score >= 1.0:
-                        candidate = ArticleCandidate(
-                            title=title,
-                            url=url,
-                            publication=publication,
-                            published_date=pub_date,
-                            summary=summary,
-                            relevance_score=score,
-                            keywords_found=keywords
-                        )
-                        candidates.append(candidate)
+                    candidates.append(ArticleCandidate(
+                        title=title,
+                        url=url,
+                        publication=publication,
+                        published_date=pub_date,
+                        summary=summary
+                    ))
                         
                 except Exception as e:
                     continue
             
+            # All of the feed's entries are scored in one batch
+            candidates = [c for c in self.score_batch(candidates) if c.relevance_score >= 1.0]
+            
         except Exception as e:
             pass
         
         return candidates
     
+    def _fetch_feed_entries(self, feed_url: str) -> Optional[List[dict]]:
+        """Download and parse a feed into entry dicts, or None if it could not be fetched"""
+        is_premium = any(domain in feed_url for domain in ['downjones.io', 'wsj.com', 'nytimes.com'])
+        
+        if is_premium:
+            response = self.make_request(
+                feed_url,
+                timeout=15,
+                headers={'Accept': 'application/rss+xml, application/xml, text/xml, */*'},
+                conditional=True
+            )
+        else:
+            response = self.make_request(feed_url, timeout=10, conditional=True)
+        
+        if response.status_code != 200:
+            return None
+        
+        # An unchanged feed reuses the entries parsed on a previous run
+        entries = None
+        if getattr(response, 'not_modified', False):
+            entries = self.http_cache.get_parsed(feed_url)
+        
+        if entries is None:
+            entries = parse_feed_entries(response.content)
+            self.http_cache.store_parsed(feed_url, entries)
+        
+        return entries
+    
     def try_multiple_rss_feeds(self, publication: str, feed_urls: List[str]) -> List[ArticleCandidate]:
         """Try to fetch articles from multiple RSS feeds"""
         all_candidates = []
@@ -528,12 +650,27 @@ class CustomArticleCollector:
         successful_feeds = 0
         feed_count = len(feed_urls)
         
-        for idx, feed_url in enumerate(feed_urls, 1):
-            candidates = self.try_rss_feed(publication, feed_url)
-            
+        # Download all feeds at once (make_request still paces each host); results are
+        # merged in the configured feed order
+        if feed_count == 1:
+            results = [(self.try_rss_feed(publication, feed_urls[0]), "")]
+        else:
+            source = self.budget.current_source() if self.budget is not None else None
+            with ThreadPoolExecutor(max_workers=min(feed_count, 4)) as executor:
+                futures = [executor.submit(self._run_as_source, source, self.try_rss_feed, publication, feed_url)
+                           for feed_url in feed_urls]
+                results = [future.result() for future in futures]
+        
+        seen_urls = set()
+        for candidates, log in results:
+            if log:
+                print(log, end="")
             if candidates:
                 successful_feeds += 1
-                all_candidates.extend(candidates)
+            for candidate in candidates:
+                if candidate.url not in seen_urls:
+                    seen_urls.add(candidate.url)
+                    all_candidates.append(candidate)
         
         if all_candidates:
             print(f"  RSS: Found {len(all_candidates)} articles from {successful_feeds}/{feed_count} feeds")
@@ -546,6 +683,15 @@ class CustomArticleCollector:
         """Enhanced URL filtering - must contain at least 1 luxury keyword"""
         url_lower = url.lower()
         
+        # Check for at least 1 luxury keyword in URL
+        has_keyword = any(keyword.lower() in url_lower for keyword in self.luxury_keywords)
+        
+        return has_keyword and not self.is_excluded_url(url)
+    
+    def is_excluded_url(self, url: str) -> bool:
+        """Section pages and off-topic URLs, whatever their title or keywords"""
+        url_lower = url.lower()
+        
         # Explicitly exclude National Jeweler category/section pages
         national_jeweler_excluded = [
             'https://nationaljeweler.com/',
@@ -578,157 +724,294 @@ class CustomArticleCollector:
         
         url_clean = url.rstrip('/')
         if url_clean in national_jeweler_excluded or url in national_jeweler_excluded:
-            return False
-        
-        # Check for at least 1 luxury keyword in URL
-        has_keyword = any(keyword.lower() in url_lower for keyword in self.luxury_keywords)
+            return True
         
         # Exclude obviously irrelevant content
         exclude_terms = [
             'recipe', 'food', 'travel', 'politics', 'sports', 'health', 'weather',
             'football', 'soccer', 'cricket', 'tennis'
         ]
-        has_excluded = any(term in url_lower for term in exclude_terms)
+        return any(term in url_lower for term in exclude_terms)
+    
+    def _load_parsed_sitemap(self, sitemap_url: str, response) -> Optional[List[tuple]]:
+        """
+        Ranked (priority, entry) pairs of an unchanged sitemap from a previous run
+        
+        Rankings made under other scoring rules (taxonomy, relevance model) are not
+        reused; entries that have since left the 7-day window are dropped.
+        """
+        if not getattr(response, 'not_modified', False):
+            return None
         
-        return has_keyword and not has_excluded
+        parsed = self.http_cache.get_parsed(sitemap_url)
+        if not isinstance(parsed, dict) or parsed.get('scoring_key') != self.scoring_key:
+            return None
+        
+        ranked = []
+        for url, lastmod, news_title, news_keywords, priority in parsed['entries']:
+            entry = SitemapEntry(url, datetime.fromisoformat(lastmod),
+                                 news_title=news_title, news_keywords=news_keywords)
+            if self._is_recent(entry):
+                ranked.append((priority, entry))
+        return ranked
+    
+    def _store_parsed_sitemap(self, sitemap_url: str, ranked: List[tuple]):
+        self.http_cache.store_parsed(sitemap_url, {
+            'scoring_key': self.scoring_key,
+            'entries': [(entry.loc, entry.lastmod.isoformat(), entry.news_title, entry.news_keywords, priority)
+                        for priority, entry in ranked]
+        })
+    
+    def _dated_entry(self, entry: SitemapEntry) -> SitemapEntry:
+        """entry with lastmod set to its best known date (news publication date, lastmod, or now)"""
+        return entry._replace(lastmod=entry.news_publication_date or entry.lastmod or datetime.now())
+    
+    def _is_recent(self, entry: SitemapEntry) -> bool:
+        # Skip articles older than 7 days (weekly collection)
+        return (datetime.now() - entry.lastmod).days <= 7
     
     def fetch_urls_from_sitemap(self, sitemap_url: str) -> List[tuple]:
-        urls = []
+        """Ranked (priority, entry) pairs of a child sitemap of a sitemap index"""
+        ranked = []
         try:
-            response = self.make_request(sitemap_url, timeout=10)
+            response = self.make_request(sitemap_url, timeout=10, conditional=True)
             if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    lastmod_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-                    
-                    if loc_elem is not None:
-                        url = loc_elem.text
-                        if lastmod_elem is not None:
-                            try:
-                                lastmod_str = lastmod_elem.text
-                                if 'T' in lastmod_str:
-                                    lastmod_date = datetime.fromisoformat(lastmod_str.replace('Z', '+00:00'))
-                                else:
-                                    lastmod_date = datetime.strptime(lastmod_str[:10], '%Y-%m-%d')
-                                lastmod_date = lastmod_date.replace(tzinfo=None)
-                            except:
-                                lastmod_date = datetime.now()
-                        else:
-                            lastmod_date = datetime.now()
-                        
-                        urls.append((url, lastmod_date))
+                ranked = self._load_parsed_sitemap(sitemap_url, response)
+                if ranked is None:
+                    ranked = self._rank_sitemap_entries(
+                        entry for entry in iter_sitemap(response.content) if not entry.is_sitemap
+                    )
+                    self._store_parsed_sitemap(sitemap_url, ranked)
         except:
             pass
         
-        return urls
+        return ranked
+    
+    def _parse_sitemap_response(self, sitemap_url: str, response) -> Optional[List[SitemapEntry]]:
+        """
+        Parse a sitemap response into its best recent entries, or None if unparseable
+        
+        A urlset is parsed in one streaming pass feeding _rank_sitemap_entries, so
+        only the top sitemap_max_urls entries are ever held. A sitemap index is
+        traversed via its recent children.
+        """
+        child_sitemaps = []
+        
+        def article_entries():
+            for entry in iter_sitemap(response.content):
+                if entry.is_sitemap:
+                    child_sitemaps.append((entry.loc, entry.lastmod))
+                else:
+                    yield entry
+        
+        try:
+            ranked = self._rank_sitemap_entries(article_entries())
+        except SitemapParseError:
+            return None
+        
+        if child_sitemaps:
+            ranked = self._fetch_sitemap_index_children(child_sitemaps)
+        else:
+            # Only urlsets are reusable as-is; an index's children are revalidated separately
+            self._store_parsed_sitemap(sitemap_url, ranked)
+        return [entry for _, entry in ranked]
+    
+    def _fetch_sitemap_index_children(self, children: List[tuple]) -> List[tuple]:
+        """
+        Fetch the child sitemaps of an index that can hold articles from the last 7 days
+        
+        Children whose <lastmod> is older than the window are skipped; the rest (newest
+        first, undated ones after dated ones, at most sitemap_max_children) are fetched
+        concurrently. Returns the best sitemap_max_urls of their ranked entries.
+        """
+        recent = [(loc, lastmod) for loc, lastmod in children
+                  if lastmod is None or (datetime.now() - lastmod).days <= 7]
+        recent.sort(key=lambda child: (child[1] is not None, child[1] or datetime.min), reverse=True)
+        recent = recent[:self.sitemap_max_children]
+        
+        skipped = len(children) - len(recent)
+        if skipped:
+            print(f"  Sitemap index: reading {len(recent)}/{len(children)} child sitemaps "
+                  f"({skipped} stale or over the limit)")
+        
+        if not recent:
+            return []
+        
+        publication = self.budget.current_source() if self.budget is not None else None
+        ranked = []
+        with ThreadPoolExecutor(max_workers=min(len(recent), 4)) as executor:
+            futures = [executor.submit(self._run_as_source, publication, self.fetch_urls_from_sitemap, loc)
+                       for loc, _ in recent]
+            for future in futures:
+                child_ranked, log = future.result()
+                ranked.extend(child_ranked)
+                if log:
+                    print(log, end="")
+        
+        # Children are already ranked: merge on their priorities without re-scoring
+        return heapq.nlargest(self.sitemap_max_urls, ranked, key=lambda item: item[0])
+    
+    def _run_as_source(self, publication: Optional[str], fn, *args) -> tuple:
+        """
+        Run fn(*args) in a helper thread on behalf of publication
+        
+        Requests are charged to the publication's budget and printed output is captured;
+        returns (result, log) so the caller can print the log in its own block.
+        """
+        if self.budget is not None and publication:
+            self.budget.join_source(publication)
+        
+        stdout = sys.stdout
+        buffered = isinstance(stdout, _ThreadBufferedStdout)
+        if buffered:
+            stdout.begin()
+        try:
+            result = fn(*args)
+        finally:
+            log = stdout.end() if buffered else ""
+        return result, log
+    
+    def _sitemap_recent_urls(self, sitemap_url: str, response) -> Optional[List[SitemapEntry]]:
+        """Recent entries from a fetched sitemap, or None if unparseable"""
+        # Unchanged urlset sitemaps skip XML parsing entirely
+        ranked = self._load_parsed_sitemap(sitemap_url, response)
+        if ranked is not None:
+            return [entry for _, entry in ranked]
+        return self._parse_sitemap_response(sitemap_url, response)
+    
+    def _sitemap_priority(self, entry: SitemapEntry) -> Optional[float]:
+        """
+        Ranking key for a dated sitemap entry, or None if it isn't a candidate at all
+        
+        News entries are judged by their news:title/keywords, so only URL exclusions
+        apply to them; other entries must pass is_relevant_url. The score is the keyword
+        score of the news metadata (or of the URL path) plus up to 10 points for recency
+        within the 7-day window.
+        """
+        if entry.news_title:
+            if self.is_excluded_url(entry.loc):
+                return None
+            score, _ = self.calculate_relevance_score(entry.news_title, entry.news_keywords or "")
+            if score < 1.0:
+                return None
+        else:
+            if not self.is_relevant_url(entry.loc):
+                return None
+            path_words = re.sub(r'[-_/.]+', ' ', urlparse(entry.loc).path)
+            score, _ = self.calculate_relevance_score(path_words, "")
+        
+        age_days = (datetime.now() - entry.lastmod).total_seconds() / 86400
+        return score + 10.0 * max(0.0, 1.0 - age_days / 7)
+    
+    def _rank_sitemap_entries(self, entries) -> List[tuple]:
+        """
+        Top sitemap_max_urls candidate entries from the last 7 days as (priority, entry), best first
+        
+        Streams entries through a bounded min-heap: O(n log K) time, O(K) memory, and
+        independent of how the publisher orders its sitemap.
+        """
+        heap = []
+        for position, entry in enumerate(entries):
+            entry = self._dated_entry(entry)
+            if not self._is_recent(entry):
+                continue
+            priority = self._sitemap_priority(entry)
+            if priority is None:
+                continue
+            
+            item = (priority, -position, entry)
+            if len(heap) < self.sitemap_max_urls:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        
+        return [(priority, entry) for priority, _, entry in sorted(heap, reverse=True)]
     
     def fetch_sitemap_articles(self, publication: str, sitemap_url: str) -> List[ArticleCandidate]:
         candidates = []
         
         try:
-            response = self.make_request(sitemap_url, timeout=15)
+            response = self.make_request(sitemap_url, timeout=15, conditional=True)
             
             if response.status_code != 200:
                 return candidates
             
-            # Try multiple decoding strategies for problematic sitemaps
-            xml_content = None
-            
-            try:
-                xml_content = response.text
-                root = ET.fromstring(xml_content)
-            except (ET.ParseError, UnicodeDecodeError):
-                xml_content = None
-            
-            if xml_content is None:
-                try:
-                    xml_content = response.content.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    xml_content = None
-            
-            if xml_content is None:
-                try:
-                    xml_content = response.content.decode('iso-8859-1')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    xml_content = None
-            
-            if xml_content is None:
-                try:
-                    import gzip
-                    decompressed = gzip.decompress(response.content)
-                    xml_content = decompressed.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except:
-                    xml_content = None
+            urls = self.parsed_memo.do(('sitemap', sitemap_url),
+                                       lambda: self._sitemap_recent_urls(sitemap_url, response))
             
-            if xml_content is None:
+            if urls is None:
                 print(f"  Sitemap error: Cannot parse XML")
                 return candidates
             
-            urls = []
-            
-            if 'sitemapindex' in root.tag:
-                for sitemap in root[:3]:
-                    loc_elem = sitemap.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    if loc_elem is not None:
-                        sub_sitemap_url = loc_elem.text
-                        urls.extend(self.fetch_urls_from_sitemap(sub_sitemap_url))
-            
-            elif 'urlset' in root.tag:
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    lastmod_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-                    
-                    if loc_elem is not None:
-                        url = loc_elem.text
-                        
-                        if lastmod_elem is not None:
-                            try:
-                                lastmod_str = lastmod_elem.text
-                                if 'T' in lastmod_str:
-                                    lastmod_date = datetime.fromisoformat(lastmod_str.replace('Z', '+00:00'))
-                                else:
-                                    lastmod_date = datetime.strptime(lastmod_str[:10], '%Y-%m-%d')
-                                lastmod_date = lastmod_date.replace(tzinfo=None)
-                                
-                                if (datetime.now() - lastmod_date).days > 7:
-                                    continue
-                            except:
-                                lastmod_date = datetime.now()
-                        else:
-                            lastmod_date = datetime.now()
-                        
-                        urls.append((url, lastmod_date))
-            
-            for url, pub_date in urls[:50]:
+            scored_from_news = 0
+            # Entries are already filtered and ranked by _rank_sitemap_entries
+            for entry in urls:
                 try:
-                    if self.is_relevant_url(url):
-                        candidate = ArticleCandidate(
-                            title="",
-                            url=url,
-                            publication=publication,
-                            published_date=pub_date,
-                            summary="",
-                            relevance_score=1.0
-                        )
-                        candidates.append(candidate)
+                    # Google News sitemaps give us a title and keywords to score without fetching
+                    if entry.news_title:
+                        score, keywords = self.calculate_relevance_score(entry.news_title, entry.news_keywords or "")
+                        scored_from_news += 1
+                    else:
+                        score, keywords = 1.0, []
+                    
+                    candidate = ArticleCandidate(
+                        title=entry.news_title or "",
+                        url=entry.loc,
+                        publication=publication,
+                        published_date=entry.lastmod,
+                        summary="",
+                        relevance_score=score,
+                        keywords_found=keywords
+                    )
+                    candidates.append(candidate)
                         
                 except Exception:
                     continue
             
             if candidates:
-                print(f"  Sitemap: Found {len(candidates)} articles")
+                if scored_from_news:
+                    print(f"  Sitemap: Found {len(candidates)} articles ({scored_from_news} scored from news:title)")
+                else:
+                    print(f"  Sitemap: Found {len(candidates)} articles")
             
         except Exception as e:
             print(f"  Sitemap error: {str(e)[:100]}")
         
         return candidates
     
+    def fetch_homepage_articles(self, publication: str, source_info: dict) -> List[ArticleCandidate]:
+        """Candidates from links on the publication's base_url page"""
+        candidates = []
+        base_url = source_info['base_url']
+        
+        response = self.make_request(base_url, timeout=15, conditional=True)
+        if response.status_code != 200:
+            return candidates
+        
+        links = self.parsed_memo.do(('homepage', base_url), lambda: self.homepage_discovery.extract_links(
+            publication, base_url, response.content, source_info.get('link_selectors')
+        ))
+        
+        for url, anchor_text in links:
+            if not anchor_text or not self.is_relevant_url(url):
+                continue
+            score, keywords = self.calculate_relevance_score(anchor_text, "")
+            if score >= 1.0:
+                candidates.append(ArticleCandidate(
+                    title=anchor_text,
+                    url=url,
+                    publication=publication,
+                    published_date=None,  # filled from the page by extract_full_content
+                    summary="",
+                    relevance_score=score,
+                    keywords_found=keywords
+                ))
+        
+        print(f"  Homepage: Found {len(candidates)} articles from {len(links)} links")
+        return candidates
+    
     def collect_from_source(self, publication: str, source_info: dict) -> List[ArticleCandidate]:
-        """Collect articles with proper fallback: sitemap → RSS"""
+        """Collect articles with proper fallback: sitemap → RSS → homepage/section links"""
         all_candidates = []
         sitemap_tried = False
         sitemap_succeeded = False
@@ -771,21 +1054,42 @@ class CustomArticleCollector:
                 else:
                     print(f"  RSS error: {error_msg[:100]}")
         
-        # Remove duplicates
+        # Last resort: article links on the section page, scored by their anchor text
+        if len(all_candidates) < 3 and source_info.get('base_url'):
+            try:
+                all_candidates.extend(self.fetch_homepage_articles(publication, source_info))
+            except Exception as e:
+                print(f"  Homepage discovery error: {str(e)[:100]}")
+        
+        # Remove duplicates (tracking parameters, AMP variants, www./trailing-slash differences)
         unique_candidates = []
         seen_urls = set()
         for candidate in all_candidates:
-            if candidate.url not in seen_urls:
+            candidate.url = canonicalize_url(candidate.url)
+            key = dedup_key(candidate.url)
+            if key not in seen_urls:
                 unique_candidates.append(candidate)
-                seen_urls.add(candidate.url)
+                seen_urls.add(key)
         
-        return unique_candidates
+        return self._drop_ruled_out(unique_candidates)
+    
+    def _drop_ruled_out(self, candidates: List[ArticleCandidate]) -> List[ArticleCandidate]:
+        """Drop articles an earlier run already rejected (or found blocked/missing)"""
+        if self.url_ledger is None:
+            return candidates
+        
+        skip = self.url_ledger.skippable(c.url for c in candidates)
+        if skip:
+            print(f"  Skipped {len(skip)} URLs already ruled out by an earlier run")
+        return [c for c in candidates if c.url not in skip]
     
     def extract_full_content(self, candidate: ArticleCandidate) -> ArticleCandidate:
         try:
-            response = self.make_request(candidate.url, timeout=20)
+            response = self.fetch_article(candidate.url, timeout=20)
             
             if response.status_code != 200:
+                if response.status_code in (403, 404):
+                    self._record_outcome(candidate, str(response.status_code))
                 return None
             
             article = Article(candidate.url)
@@ -793,7 +1097,14 @@ class CustomArticleCollector:
             article.html = response.text
             article.parse()
             
+            # Syndicated copies and mirrors point rel=canonical at an article we may already have
+            if article.canonical_link and not self._claim_url(
+                    dedup_key(candidate.url, article.canonical_link), candidate):
+                print(f"  Duplicate of an article already collected ({article.canonical_link[:80]})")
+                return None
+            
             if not article.text or len(article.text) < 150:
+                self._record_outcome(candidate, 'rejected-length')
                 return None
             
             candidate.full_content = article.text
@@ -801,12 +1112,20 @@ class CustomArticleCollector:
             if not candidate.title and article.title:
                 candidate.title = article.title
             
+            # Homepage links have no date until the page tells us
+            if candidate.published_date is None and article.publish_date:
+                candidate.published_date = article.publish_date.replace(tzinfo=None)
+                if (datetime.now() - candidate.published_date).days > 7:
+                    print(f"  Skipping {candidate.url[:80]} - published {candidate.published_date:%Y-%m-%d}")
+                    return None
+            
             full_score, full_keywords = self.calculate_relevance_score(
                 candidate.title or "", article.text
             )
             
             candidate.relevance_score = full_score
             candidate.keywords_found = full_keywords
+            self.corpus_stats.add_document(candidate.url, len(article.text.split()), full_keywords)
 
             # Extract author using AgentSumm if available, otherwise fallback
             if AGENTSUMM_AVAILABLE:
@@ -819,8 +1138,10 @@ class CustomArticleCollector:
             
             # Threshold 1.0 for weekly collection
             if full_score >= 1.0:
+                self._record_outcome(candidate, 'collected')
                 return candidate
             else:
+                self._record_outcome(candidate, 'rejected-score')
                 return None
             
         except Exception as e:
@@ -833,97 +1154,344 @@ class CustomArticleCollector:
                 print(f"  Error: HTTP 429 Rate Limited - {candidate.publication}")
             elif 'timeout' in error_msg.lower():
                 print(f"  Error: Timeout - {candidate.publication}")
+            elif isinstance(e, BudgetExhausted):
+                print(f"  Error: {error_msg} - {candidate.publication}")
+            elif isinstance(e, CircuitOpenError):
+                print(f"  Error: Host blocked, circuit open - {candidate.publication}")
             elif 'SSL' in error_msg or 'ssl' in error_msg.lower():
                 print(f"  Error: SSL blocking - {candidate.publication}")
             else:
                 print(f"  Error: {error_msg[:60]} - {candidate.publication}")
             return None
     
-    def collect_top_3_per_publication(self, sources_subset: List[str] = None) -> List[ArticleCandidate]:
-        """Collect exactly top 3 articles from each publication"""
-        print("Weekly Article Collection (Top 3 per Publication)")
-        print("=" * 60)
+    def _claim_url(self, key: str, candidate: ArticleCandidate) -> bool:
+        """
+        Reserve an article (by dedup key) for candidate; False if another candidate
+        already holds it, including another publication offering the very same URL
+        """
+        claimant = (candidate.publication, candidate.url)
+        with self._claimed_lock:
+            holder = self._claimed_urls.setdefault(key, claimant)
+            if holder != claimant:
+                self.duplicates_skipped += 1
+                return False
+            return True
+    
+    def _release_claims(self, candidate: ArticleCandidate):
+        """Drop the claims candidate holds (its own dedup key and any rel=canonical key)"""
+        claimant = (candidate.publication, candidate.url)
+        with self._claimed_lock:
+            for key in [key for key, holder in self._claimed_urls.items() if holder == claimant]:
+                self._claimed_urls.pop(key, None)
+    
+    def _is_weaker_copy(self, candidate: ArticleCandidate) -> bool:
+        """
+        True if a near-identical article scoring at least as high was already collected
+        this run, so the publication can move on to its next candidate. Copies that
+        score higher are kept; the end-of-run pass drops the weaker one (and remains
+        a safety net for anything else that slips through).
+        """
+        fingerprint = simhash(candidate.full_content)
+        # Keyed per publication: two sources can carry the very same URL
+        key = (candidate.publication, candidate.url)
+        self._fingerprinted[key] = candidate
         
-        sources_to_use = sources_subset if sources_subset else list(self.target_sources.keys())
-        print(f"Targeting {len(sources_to_use)} publications\n")
+        # Match and insert happen under the index's lock, so two workers can't both accept one story
+        stronger = self.near_duplicates.check_and_add(
+            key, fingerprint,
+            lambda match: match != key and self._fingerprinted[match].relevance_score >= candidate.relevance_score
+        )
+        if stronger is None:
+            return False
         
-        all_articles = []
+        self._fingerprinted.pop(key, None)
+        print(f"  Near-duplicate of a {self._fingerprinted[stronger].publication} article - skipped")
+        with self._claimed_lock:
+            self.duplicates_skipped += 1
+        return True
+    
+    def _record_outcome(self, candidate: ArticleCandidate, outcome: str):
+        if self.url_ledger is not None:
+            self.url_ledger.record(candidate.url, outcome, candidate.publication, candidate.relevance_score)
+    
+    def collect_publication(self, publication: str) -> List[ArticleCandidate]:
+        """Collect the top 3 articles from a single publication"""
+        candidates = self._discover_candidates(publication)
+        if not candidates:
+            return []
+        return self._extract_top_3(publication, candidates)
+    
+    def _discover_candidates(self, publication: str) -> List[ArticleCandidate]:
+        """Discovery half of collect_publication: the publication's candidates, best first"""
+        print(f"{publication}:")
+        source_info = self.target_sources[publication]
         
-        for publication in sources_to_use:
-            if publication not in self.target_sources:
-                continue
-                
-            print(f"{publication}:")
-            self.requests_per_source = 0
-            source_info = self.target_sources[publication]
+        if self.budget is not None:
+            if self.budget.expired():
+                print(f"  Skipped - collection deadline reached\n")
+                return []
+            self.budget.begin_source(publication)
+        
+        # Initial collection attempt
+        candidates = self.collect_from_source(publication, source_info)
+        
+        if not candidates:
+            print(f"  No candidates found\n")
+            return []
+        
+        candidates.sort(key=lambda x: x.relevance_score, reverse=True)
+        if self.budget is not None:
+            self.budget.pause_source(publication)
+        return candidates
+    
+    def _extract_top_3(self, publication: str, candidates: List[ArticleCandidate]) -> List[ArticleCandidate]:
+        """Extraction half of collect_publication: fetch candidates until 3 articles are collected"""
+        source_info = self.target_sources[publication]
+        if self.budget is not None:
+            self.budget.resume_source(publication)
+        
+        # Extract full content and collect articles
+        # (politeness delays between fetches are enforced per host by make_request)
+        publication_articles = []
+        max_tries = min(len(candidates), 20)
+        
+        skipped_blocked = 0
+        skipped_duplicates = 0
+        
+        for candidate in candidates[:max_tries]:
+            if len(publication_articles) >= 3:
+                break
             
-            # Initial collection attempt
-            candidates = self.collect_from_source(publication, source_info)
+            if self._budget_exhausted():
+                print(f"  Stopping early: {self.budget.exhausted_reason()}")
+                break
             
-            if not candidates:
-                print(f"  No candidates found\n")
-                time.sleep(random.uniform(3, 6))
+            # Don't spend the rest of the source's budget on a host that is blocking us
+            if self.circuit_breaker.is_open(candidate.url):
+                skipped_blocked += 1
                 continue
             
-            candidates.sort(key=lambda x: x.relevance_score, reverse=True)
+            # Another publication (or feed) already took this article this run
+            if not self._claim_url(dedup_key(candidate.url), candidate):
+                skipped_duplicates += 1
+                continue
             
-            # Extract full content and collect articles
-            publication_articles = []
-            max_tries = min(len(candidates), 20)
+            enhanced = self.extract_full_content(candidate)
+            if enhanced is None:
+                # Nobody collected it: let other publications linking the story try it
+                self._release_claims(candidate)
+            elif not self._is_weaker_copy(enhanced):
+                publication_articles.append(enhanced)
+        
+        if skipped_blocked:
+            print(f"  Skipped {skipped_blocked} candidates on blocked hosts (circuit open)")
+        if skipped_duplicates:
+            print(f"  Skipped {skipped_duplicates} candidates already taken by another source")
+        
+        # If we didn't get 3 articles, try RSS as additional fallback (unless every feed host is blocked)
+        feeds_available = [url for url in source_info.get('rss_feeds', []) if not self.circuit_breaker.is_open(url)]
+        if len(publication_articles) < 3 and feeds_available and not self._budget_exhausted():
+            print(f"  Only collected {len(publication_articles)} articles - trying RSS for more...")
             
-            for candidate in candidates[:max_tries]:
-                if len(publication_articles) >= 3:
-                    break
-                
-                enhanced = self.extract_full_content(candidate)
-                if enhanced:
-                    publication_articles.append(enhanced)
+            try:
+                rss_candidates = self.try_multiple_rss_feeds(publication, feeds_available)
                 
-                time.sleep(random.uniform(1, 2))
-            
-            # If we didn't get 3 articles, try RSS as additional fallback
-            if len(publication_articles) < 3 and source_info.get('rss_feeds'):
-                print(f"  Only collected {len(publication_articles)} articles - trying RSS for more...")
+                # Remove candidates we already tried
+                tried_urls = {c.url for c in candidates}
+                new_rss_candidates = self._drop_ruled_out([c for c in rss_candidates if c.url not in tried_urls])
+                if new_rss_candidates and self.semantic is not None:
+                    new_rss_candidates = self._semantic_filter(new_rss_candidates)
                 
-                try:
-                    rss_candidates = self.try_multiple_rss_feeds(publication, source_info['rss_feeds'])
-                    
-                    # Remove candidates we already tried
-                    tried_urls = {c.url for c in candidates}
-                    new_rss_candidates = [c for c in rss_candidates if c.url not in tried_urls]
+                if new_rss_candidates:
+                    print(f"  Found {len(new_rss_candidates)} new RSS candidates to try...")
+                    new_rss_candidates.sort(key=lambda x: x.relevance_score, reverse=True)
                     
-                    if new_rss_candidates:
-                        print(f"  Found {len(new_rss_candidates)} new RSS candidates to try...")
-                        new_rss_candidates.sort(key=lambda x: x.relevance_score, reverse=True)
+                    # Try to extract from new RSS candidates
+                    for candidate in new_rss_candidates[:10]:
+                        if len(publication_articles) >= 3:
+                            break
                         
-                        # Try to extract from new RSS candidates
-                        for candidate in new_rss_candidates[:10]:
-                            if len(publication_articles) >= 3:
-                                break
-                            
-                            enhanced = self.extract_full_content(candidate)
-                            if enhanced:
-                                publication_articles.append(enhanced)
-                            
-                            time.sleep(random.uniform(1, 2))
-                except Exception as e:
-                    print(f"  RSS fallback error: {str(e)[:60]}")
-            
-            publication_articles.sort(key=lambda x: x.relevance_score, reverse=True)
-            final_3 = publication_articles[:3]
-            
-            if final_3:
-                scores = [f"{a.relevance_score:.1f}" for a in final_3]
-                print(f"  Collected: {len(final_3)} article(s) [scores: {', '.join(scores)}]\n")
-            else:
-                print(f"  Collected: 0 articles\n")
-            
-            all_articles.extend(final_3)
-            
-            time.sleep(random.uniform(3, 6))
+                        if self._budget_exhausted():
+                            print(f"  Stopping early: {self.budget.exhausted_reason()}")
+                            break
+                        
+                        if self.circuit_breaker.is_open(candidate.url):
+                            continue
+                        
+                        if not self._claim_url(dedup_key(candidate.url), candidate):
+                            continue
+                        
+                        enhanced = self.extract_full_content(candidate)
+                        if enhanced is None:
+                            self._release_claims(candidate)
+                        elif not self._is_weaker_copy(enhanced):
+                            publication_articles.append(enhanced)
+            except Exception as e:
+                print(f"  RSS fallback error: {str(e)[:60]}")
+        
+        publication_articles.sort(key=lambda x: x.relevance_score, reverse=True)
+        final_3 = publication_articles[:3]
+        
+        if self.budget is not None:
+            self.budget.record_articles(len(final_3))
+        
+        if final_3:
+            scores = [f"{a.relevance_score:.1f}" for a in final_3]
+            print(f"  Collected: {len(final_3)} article(s) [scores: {', '.join(scores)}]\n")
+        else:
+            print(f"  Collected: 0 articles\n")
+        
+        return final_3
+    
+    def _budget_exhausted(self) -> bool:
+        """True once this thread's source (or the whole run) has spent its budget"""
+        return self.budget is not None and self.budget.exhausted_reason() is not None
+    
+    def _semantic_filter(self, candidates: List[ArticleCandidate]) -> List[ArticleCandidate]:
+        """Drop candidates whose title + summary isn't close to any taxonomy topic (one batch)"""
+        def record(candidate, similarity, topic):
+            candidate.semantic_score = similarity
+        
+        def text(candidate):
+            # Plain sitemap entries have no title yet; their URL slug is all we know
+            title = candidate.title or " ".join(slug_tokens(candidate.url))
+            return f"{title}. {candidate.summary[:500]}"
+        
+        try:
+            kept, _ = self.semantic.filter(candidates, text, on_score=record)
+        except Exception as e:
+            # A model that can't be loaded or run must not stop the collection
+            print(f"⚠️  Semantic relevance failed, keeping all candidates: {str(e)[:100]}")
+            self.semantic = None
+            return candidates
+        return kept
+    
+    def _collect_publication_buffered(self, publication: str, stdout: _ThreadBufferedStdout,
+                                      fn=None, *args) -> tuple:
+        """Run collect_publication (or another per-publication step) in a worker thread, capturing its log output"""
+        stdout.begin()
+        try:
+            articles = (fn or self.collect_publication)(publication, *args)
+        except Exception as e:
+            print(f"  Collection error: {str(e)[:100]}\n")
+            articles = []
+        finally:
+            log = stdout.end()
+        return articles, log
+    
+    def _collect_in_phases(self, executor, sources_to_use: List[str], buffered_stdout: _ThreadBufferedStdout,
+                           output, results: dict):
+        """
+        Discover every publication, semantically filter all candidates in one batch, then extract
+        
+        Each publication's discovery and extraction logs are still printed as one block.
+        """
+        discovered = {}
+        futures = {
+            executor.submit(self._collect_publication_buffered, publication, buffered_stdout,
+                            self._discover_candidates): publication
+            for publication in sources_to_use
+        }
+        for future in as_completed(futures):
+            discovered[futures[future]] = future.result()
+        
+        all_candidates = [c for candidates, _ in discovered.values() for c in candidates]
+        kept = {id(c) for c in self._semantic_filter(all_candidates)} if all_candidates else set()
+        
+        futures = {}
+        for publication in sources_to_use:
+            candidates, log = discovered[publication]
+            relevant = [c for c in candidates if id(c) in kept]
+            if len(relevant) < len(candidates):
+                log += f"  Semantic filter: {len(relevant)}/{len(candidates)} candidates on topic\n"
+            if not relevant:
+                output.write(log + ("" if not candidates else "  Collected: 0 articles\n\n"))
+                output.flush()
+                results[publication] = []
+                continue
+            future = executor.submit(self._collect_publication_buffered, publication, buffered_stdout,
+                                     self._extract_top_3, relevant)
+            futures[future] = (publication, log)
+        
+        for future in as_completed(futures):
+            publication, discovery_log = futures[future]
+            articles, log = future.result()
+            results[publication] = articles
+            output.write(discovery_log + log)
+            output.flush()
+    
+    def collect_top_3_per_publication(self, sources_subset: List[str] = None) -> List[ArticleCandidate]:
+        """Collect exactly top 3 articles from each publication, crawling publications concurrently"""
+        print("Weekly Article Collection (Top 3 per Publication)")
+        print("=" * 60)
+        
+        sources_to_use = sources_subset if sources_subset else list(self.target_sources.keys())
+        sources_to_use = [p for p in sources_to_use if p in self.target_sources]
+        print(f"Targeting {len(sources_to_use)} publications ({self.max_workers} parallel workers)\n")
+        
+        # Coalescing and dedup are per run: a new run revalidates every feed and sitemap
+        self.request_memo.clear()
+        self.parsed_memo.clear()
+        self.homepage_discovery.clear()
+        self._claimed_urls.clear()
+        self.near_duplicates.clear()
+        self._fingerprinted.clear()
+        self.duplicates_skipped = 0
+        
+        results = {}
+        original_stdout = sys.stdout
+        buffered_stdout = _ThreadBufferedStdout(original_stdout)
+        sys.stdout = buffered_stdout
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                if self.semantic is not None:
+                    self._collect_in_phases(executor, sources_to_use, buffered_stdout, original_stdout, results)
+                else:
+                    futures = {
+                        executor.submit(self._collect_publication_buffered, publication, buffered_stdout): publication
+                        for publication in sources_to_use
+                    }
+                    
+                    # Print each publication's log as one block when it finishes
+                    for future in as_completed(futures):
+                        articles, log = future.result()
+                        results[futures[future]] = articles
+                        original_stdout.write(log)
+                        original_stdout.flush()
+        finally:
+            sys.stdout = original_stdout
+            self.corpus_stats.flush()
+        
+        # Keep the configured publication order in the output
+        all_articles = []
+        for publication in sources_to_use:
+            all_articles.extend(results.get(publication, []))
+        
+        # Copies that raced past _is_weaker_copy: keep the highest-scoring one of each story
+        all_articles, dropped = drop_near_duplicates(
+            all_articles, lambda a: a.full_content, lambda a: a.relevance_score
+        )
+        for article, kept in dropped:
+            print(f"Near-duplicate dropped: {article.publication} - {article.title[:60]} "
+                  f"(same story as {kept.publication})")
+        self.duplicates_skipped += len(dropped)
         
         print(f"Collection complete: {len(all_articles)} total articles")
         print(f"Publications covered: {len(set(a.publication for a in all_articles))}/{len(sources_to_use)}")
+        print(self.rate_limiter.format_report())
+        print(self.client_pool.format_report())
+        print(self.circuit_breaker.format_report())
+        print(self.request_memo.format_report())
+        print(self.parsed_memo.format_report())
+        print(f"Dedup: {self.duplicates_skipped} duplicate links/near-duplicate articles skipped")
+        if self.url_ledger is not None:
+            print(self.url_ledger.format_report())
+        if self.semantic is not None:
+            print(self.semantic.format_report())
+        print(f"Relevance model: {self.relevance_model} | {self.corpus_stats.format_report()}")
+        if self.budget is not None:
+            print(self.budget.format_report())
         
         return all_articles
     
@@ -961,7 +1529,7 @@ class CustomArticleCollector:
         for i, article in enumerate(articles, 1):
             report.append(f"{i}. {article.title}")
             report.append(f"   {article.publication} | {article.author} | Score: {article.relevance_score:.1f}")
-            report.append(f"   {article.published_date.strftime('%Y-%m-%d')}")
+            report.append(f"   {article.published_date.strftime('%Y-%m-%d') if article.published_date else 'Date unknown'}")
             report.append(f"   {article.url}\n")
         
         return "\n".join(report)
@@ -974,7 +1542,7 @@ class CustomArticleCollector:
                 'url': article.url,
                 'publication': article.publication,
                 'author': article.author,
-                'published_date': article.published_date.isoformat(),
+                'published_date': article.published_date.isoformat() if article.published_date else None,
                 'summary': article.summary,
                 'full_content': article.full_content,
                 'relevance_score': article.relevance_score,
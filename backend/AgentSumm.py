@@ -7,13 +7,12 @@ import re
 import json
 from bs4 import BeautifulSoup
 import random
+from html_cache import get_default_html_cache
 
-# Try to import cloudscraper for CloudFlare bypass
-try:
-    import cloudscraper
-    CLOUDSCRAPER_AVAILABLE = True
-except ImportError:
-    CLOUDSCRAPER_AVAILABLE = False
+# Shared client pool (curl-cffi, then cloudscraper, then requests) for CloudFlare bypass
+from client_pool import get_default_client_pool, CLOUDSCRAPER_AVAILABLE
+
+if not CLOUDSCRAPER_AVAILABLE:
     print("Note: Install cloudscraper for better anti-blocking: pip install cloudscraper")
 
 @dataclass
@@ -31,19 +30,10 @@ class ArticleSummarizer:
         print(f"Loading model: {model} ... this may take a moment.")
         self.summarizer = pipeline("summarization", model=model)
         
-        # Setup CloudScraper if available
-        if CLOUDSCRAPER_AVAILABLE:
-            self.scraper = cloudscraper.create_scraper(
-                browser={
-                    'browser': 'chrome',
-                    'platform': 'windows',
-                    'mobile': False
-                }
-            )
-            print("CloudScraper enabled for anti-blocking")
-        else:
-            import requests
-            self.scraper = requests.Session()
+        # Reuse the collector's pooled keep-alive sessions instead of a private scraper
+        self.client_pool = get_default_client_pool()
+        if self.client_pool.scraper_type != 'requests':
+            print(f"{self.client_pool.scraper_type} enabled for anti-blocking")
         
         # User-Agent rotation
         self.user_agents = [
@@ -52,10 +42,30 @@ class ArticleSummarizer:
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0'
         ]
+        
+        # Article pages already fetched by the collector are served from the shared cache
+        self.html_cache = get_default_html_cache()
     
     def get_random_user_agent(self):
         """Get a random User-Agent"""
         return random.choice(self.user_agents)
+    
+    def fetch_article(self, url: str, timeout: int = 20):
+        """Download article HTML, using the shared HTML cache when the page is already stored"""
+        cached = self.html_cache.get_response(url)
+        if cached is not None:
+            return cached
+        
+        headers = {
+            'User-Agent': self.get_random_user_agent(),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9'
+        }
+        
+        response = self.client_pool.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 200:
+            self.html_cache.put(url, response.text)
+        return response
 
     def summarize_article(
         self,
@@ -173,14 +183,8 @@ def main():
     try:
         print("Extracting article content...")
         
-        # Download HTML using CloudScraper (bypasses blocks)
-        headers = {
-            'User-Agent': summarizer.get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9'
-        }
-        
-        response = summarizer.scraper.get(url, headers=headers, timeout=20)
+        # Download HTML using CloudScraper (bypasses blocks), or reuse the cached page
+        response = summarizer.fetch_article(url, timeout=20)
         
         if response.status_code != 200:
             print(f"Error: HTTP {response.status_code}")
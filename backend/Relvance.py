@@ -23,7 +23,7 @@ def check_article_relevance(url: str):
     try:
         # Download and parse article
         print("Step 1: Downloading article...")
-        response = collector.make_request(url, timeout=20)
+        response = collector.fetch_article(url, timeout=20)
         
         if response.status_code != 200:
             print(f"❌ Failed to download: HTTP {response.status_code}")
@@ -151,7 +151,7 @@ def batch_mode(urls: list[str]):
             collector = CustomArticleCollector()
             
             # Quick check
-            response = collector.make_request(url, timeout=20)
+            response = collector.fetch_article(url, timeout=20)
             article = Article(url)
             article.download_state = 2
             article.html = response.text
@@ -0,0 +1,126 @@
+"""
+Batch Relevance Scoring
+Scores many documents against the keyword taxonomy at once: each document is
+scanned once, matches go into a sparse document x keyword matrix, and weights and
+multi-match bonuses are applied in vectorized form (NumPy/SciPy when installed)
+
+Usage (re-score a saved archive after a taxonomy change):
+    python batch_scoring.py collected_articles.json [--taxonomy keywords.json]
+                            [--threshold 3.0] [--output rescored.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Sequence, Tuple
+
+from keyword_taxonomy import KeywordTaxonomy, load_taxonomy, TaxonomyError
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+def _match_matrix(taxonomy: KeywordTaxonomy, found: List[List[str]]):
+    """Binary document x keyword matrix (CSR when SciPy is available)"""
+    column = {keyword: index for index, keyword in enumerate(taxonomy.keywords)}
+    rows, cols = [], []
+    for row, keywords in enumerate(found):
+        rows.extend([row] * len(keywords))
+        cols.extend(column[keyword] for keyword in keywords)
+
+    shape = (len(found), len(taxonomy.keywords))
+    if SCIPY_AVAILABLE:
+        return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=shape)
+    matrix = np.zeros(shape)
+    matrix[rows, cols] = 1.0
+    return matrix
+
+
+def score_batch(taxonomy: KeywordTaxonomy, documents: Sequence[str]) -> List[Tuple[float, List[str]]]:
+    """
+    (score, keywords found) for every document, as taxonomy.score would give
+
+    Falls back to scoring one document at a time when NumPy isn't installed.
+    """
+    if not NUMPY_AVAILABLE:
+        return [taxonomy.score(document) for document in documents]
+    if not documents:
+        return []
+
+    found = [taxonomy.matcher.find(document) for document in documents]
+    matrix = _match_matrix(taxonomy, found)
+
+    weights = np.array([taxonomy.weights[keyword] for keyword in taxonomy.keywords])
+    scores = np.asarray(matrix @ weights).ravel()
+    counts = np.array([len(keywords) for keywords in found])
+    for min_matches, multiplier in taxonomy.bonuses:
+        scores = np.where(counts >= min_matches, scores * multiplier, scores)
+
+    return [(float(score), keywords) for score, keywords in zip(scores, found)]
+
+
+def _article_text(article: dict) -> str:
+    return f"{article.get('title') or ''} {article.get('full_content') or article.get('summary') or ''}"
+
+
+def rescore_archive(path: str, taxonomy: KeywordTaxonomy, threshold: float = 3.0) -> Tuple[list, dict]:
+    """Re-score the articles saved by save_results; returns (articles, stats)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        articles = json.load(f)
+
+    start = time.time()
+    results = score_batch(taxonomy, [_article_text(article) for article in articles])
+    elapsed = time.time() - start
+
+    stats = {'articles': len(articles), 'changed': 0, 'below_threshold': 0, 'seconds': elapsed}
+    for article, (score, keywords) in zip(articles, results):
+        if abs(score - (article.get('relevance_score') or 0.0)) > 1e-6:
+            stats['changed'] += 1
+        if score < threshold:
+            stats['below_threshold'] += 1
+        article['relevance_score'] = score
+        article['keywords_found'] = keywords
+        article['taxonomy'] = taxonomy.cache_key
+
+    return articles, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-score saved articles against the keyword taxonomy")
+    parser.add_argument('archive', help="JSON file written by save_results")
+    parser.add_argument('--taxonomy', help="taxonomy file (default: keywords.json / COLLECTOR_KEYWORDS)")
+    parser.add_argument('--threshold', type=float, default=3.0, help="score an article must reach to be kept")
+    parser.add_argument('--output', help="write the re-scored articles here")
+    args = parser.parse_args(argv)
+
+    try:
+        taxonomy = load_taxonomy(args.taxonomy)
+        articles, stats = rescore_archive(args.archive, taxonomy, args.threshold)
+    except (OSError, json.JSONDecodeError, TaxonomyError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    backend = "SciPy sparse" if SCIPY_AVAILABLE else "NumPy" if NUMPY_AVAILABLE else "pure Python"
+    print(f"Taxonomy {taxonomy.cache_key} ({len(taxonomy.keywords)} keywords), scored with {backend}")
+    print(f"Re-scored {stats['articles']} articles in {stats['seconds']:.2f}s: "
+          f"{stats['changed']} changed, {stats['below_threshold']} below {args.threshold}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(articles, f, indent=2, ensure_ascii=False)
+        print(f"Saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+Collector Throughput Benchmark
+Serves synthetic sitemaps, RSS feeds and article pages for every publication in
+target_sources from local HTTP servers, runs the collector (and optionally the
+summarizer) against them and reports articles/minute, per-stage time and peak RSS
+
+Usage:
+    python benchmark.py [--latency-ms 50] [--error-rate 0.05] [--page-kb 12]
+                        [--articles 40] [--no-throttle] [--skip-summarize] [--json out.json]
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+RELEVANT_TOPICS = [
+    ('diamond-necklace', 'Diamond necklace', 'diamond necklace jewellery luxury'),
+    ('royal-tiara', 'Royal tiara', 'royal tiara crown jewels coronation'),
+    ('cartier-watches', 'Cartier watches', 'cartier watches timepiece luxury'),
+    ('fine-jewellery-auction', 'Fine jewellery auction', 'fine jewellery auction sapphire emerald'),
+    ('lab-grown-diamonds', 'Lab grown diamonds', 'lab grown diamonds diamond price gold price'),
+]
+IRRELEVANT_TOPICS = [
+    ('football-results', 'Football results', 'football match league goals'),
+    ('weather-update', 'Weather update', 'rain wind forecast temperatures'),
+    ('recipe-roundup', 'Recipe roundup', 'recipe dinner oven garlic'),
+]
+FILLER_WORDS = ("announcement attention collectors industry observers craftsmanship history house "
+                "season design atelier client market buyers heritage stones setting workshop archive "
+                "designer family founder demand boutique london paris interview price editor piece "
+                "record sale week months estimate private owner museum exhibition gallery").split()
+# newspaper scores paragraphs by stopword density, so filler must read like prose
+STOPWORDS = "the of and to in was that for with it as on by at from said which their this".split()
+SITEMAP_FLAVOURS = ['urlset', 'urlset-gz', 'sitemapindex', 'news']
+
+
+class MockPublisher:
+    """Synthetic content for one publication, served by its own HTTP server"""
+
+    def __init__(self, name: str, index: int, args):
+        self.name = name
+        self.slug = ''.join(c.lower() if c.isalnum() else '-' for c in name).strip('-')
+        self.args = args
+        self.flavour = SITEMAP_FLAVOURS[index % len(SITEMAP_FLAVOURS)]
+        self.rng = random.Random(args.seed + index)
+        self.rng_lock = threading.Lock()
+        self.requests_served = 0
+        self.errors_injected = 0
+        self.base_url = None
+
+        now = datetime.now()
+        self.articles = []
+        for i in range(args.articles):
+            relevant = i % 3 != 2
+            topic = (RELEVANT_TOPICS if relevant else IRRELEVANT_TOPICS)[i % (5 if relevant else 3)]
+            # Every fifth article is outside the 7-day collection window
+            age = timedelta(days=10 + i) if i % 5 == 4 else timedelta(hours=6 * i)
+            self.articles.append({
+                'path': f"/articles/{self.slug}-{topic[0]}-{i}",
+                'title': f"{topic[1]} story {i} from {name}",
+                'keywords': topic[2],
+                'date': now - age,
+            })
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def sitemap_path(self) -> str:
+        return {
+            'urlset': '/sitemap.xml',
+            'urlset-gz': '/sitemap.xml.gz',
+            'sitemapindex': '/sitemap-index.xml',
+            'news': '/sitemap-news.xml',
+        }[self.flavour]
+
+    def urlset(self, articles, news: bool = False) -> bytes:
+        namespaces = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        if news:
+            namespaces += ' xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"'
+        entries = []
+        for article in articles:
+            entry = f"<url><loc>{escape(self.url(article['path']))}</loc>" \
+                    f"<lastmod>{article['date'].strftime('%Y-%m-%dT%H:%M:%SZ')}</lastmod>"
+            if news:
+                entry += (f"<news:news><news:publication><news:name>{escape(self.name)}</news:name>"
+                          f"<news:language>en</news:language></news:publication>"
+                          f"<news:publication_date>{article['date'].strftime('%Y-%m-%dT%H:%M:%SZ')}"
+                          f"</news:publication_date><news:title>{escape(article['title'])}</news:title>"
+                          f"<news:keywords>{escape(article['keywords'])}</news:keywords></news:news>")
+            entries.append(entry + "</url>")
+        return (f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset {namespaces}>'
+                + "".join(entries) + "</urlset>").encode('utf-8')
+
+    def sitemap_index(self) -> bytes:
+        children = []
+        for n in range(3):
+            # The last child is stale and should not need crawling
+            lastmod = datetime.now() - (timedelta(days=30) if n == 2 else timedelta(hours=n))
+            children.append(f"<sitemap><loc>{self.url(f'/sitemaps/{n}.xml')}</loc>"
+                            f"<lastmod>{lastmod.strftime('%Y-%m-%dT%H:%M:%SZ')}</lastmod></sitemap>")
+        return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                + "".join(children) + "</sitemapindex>").encode('utf-8')
+
+    def feed(self) -> bytes:
+        items = []
+        for article in self.articles[::2]:
+            items.append(f"<item><title>{escape(article['title'])}</title>"
+                         f"<link>{escape(self.url(article['path']))}</link>"
+                         f"<description>{escape(article['keywords'])}</description>"
+                         f"<pubDate>{formatdate(article['date'].timestamp(), usegmt=True)}</pubDate></item>")
+        return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+                f"<title>{escape(self.name)}</title>" + "".join(items) + "</channel></rss>").encode('utf-8')
+
+    def article_page(self, article) -> bytes:
+        # Distinct text per article (seeded by path), so pages aren't near-duplicates of each other
+        rng = random.Random(f"{self.args.seed}{article['path']}")
+        paragraphs, size = [], 0
+        while size < self.args.page_kb * 1024:
+            filler = " ".join(f"{rng.choice(STOPWORDS)} {rng.choice(FILLER_WORDS)}" for _ in range(20))
+            paragraph = f"{article['title']} brings {article['keywords']} into focus. {filler}."
+            paragraphs.append(f"<p>{escape(paragraph)}</p>")
+            size += len(paragraph)
+        body = "".join(paragraphs)
+        return (f"<html><head><title>{escape(article['title'])}</title>"
+                f"<meta name=\"description\" content=\"{escape(article['keywords'])}\">"
+                f"<meta name=\"author\" content=\"Jane Writer\"></head><body>"
+                f"<h1>{escape(article['title'])}</h1><p>By Jane Writer</p>"
+                f"<article>{body}</article></body></html>").encode('utf-8')
+
+    def homepage(self) -> bytes:
+        links = "".join(f"<h3><a href=\"{article['path']}\">{escape(article['title'])}</a></h3>"
+                        for article in self.articles)
+        return f"<html><body><main>{links}</main></body></html>".encode('utf-8')
+
+    def route(self, path: str):
+        """Return (status, content_type, body) for a request path"""
+        path = path.split('?')[0]
+        if path == '/sitemap.xml':
+            return 200, 'application/xml', self.urlset(self.articles)
+        if path == '/sitemap.xml.gz':
+            return 200, 'application/x-gzip', gzip.compress(self.urlset(self.articles))
+        if path == '/sitemap-news.xml':
+            return 200, 'application/xml', self.urlset(self.articles, news=True)
+        if path == '/sitemap-index.xml':
+            return 200, 'application/xml', self.sitemap_index()
+        if path.startswith('/sitemaps/'):
+            n = int(path.rsplit('/', 1)[-1].split('.')[0])
+            return 200, 'application/xml', self.urlset(self.articles[n::3])
+        if path == '/feed.xml':
+            return 200, 'application/rss+xml', self.feed()
+        if path == '/':
+            return 200, 'text/html; charset=utf-8', self.homepage()
+        for article in self.articles:
+            if article['path'] == path:
+                return 200, 'text/html; charset=utf-8', self.article_page(article)
+        return 404, 'text/plain', b'Not found'
+
+    def should_inject_error(self, path: str):
+        if not path.startswith('/articles/') or self.args.error_rate <= 0:
+            return None
+        with self.rng_lock:
+            if self.rng.random() >= self.args.error_rate:
+                return None
+            self.errors_injected += 1
+            return self.rng.choice([403, 429])
+
+    def latency(self) -> float:
+        with self.rng_lock:
+            return (self.args.latency_ms + self.rng.uniform(0, self.args.latency_ms / 2)) / 1000
+
+
+def make_handler(publisher: MockPublisher):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            publisher.requests_served += 1
+            time.sleep(publisher.latency())
+
+            status = publisher.should_inject_error(self.path)
+            if status:
+                content_type, body = 'text/plain', b'Blocked'
+            else:
+                status, content_type, body = publisher.route(self.path)
+
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_publishers(source_names, args):
+    """Start one server per publication (distinct ports act as distinct hosts)"""
+    publishers, servers = {}, []
+    for index, name in enumerate(source_names):
+        publisher = MockPublisher(name, index, args)
+        server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(publisher))
+        server.daemon_threads = True
+        publisher.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        publishers[name] = publisher
+        servers.append(server)
+    return publishers, servers
+
+
+class StageTimer:
+    """Accumulates wall time and call counts of wrapped methods, across threads"""
+
+    def __init__(self):
+        self.totals = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, obj, method_name: str, stage: str):
+        original = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    seconds, calls = self.totals.get(stage, (0.0, 0))
+                    self.totals[stage] = (seconds + elapsed, calls + 1)
+
+        setattr(obj, method_name, timed)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_benchmark(args) -> dict:
+    from AgentCollector import CustomArticleCollector
+
+    collector = CustomArticleCollector()
+    source_names = list(collector.target_sources.keys())
+    if args.sources:
+        source_names = source_names[:args.sources]
+
+    publishers, servers = start_publishers(source_names, args)
+
+    # Point every source at its mock server, keeping the shape of its real config
+    for name in source_names:
+        publisher = publishers[name]
+        source_info = collector.target_sources[name]
+        source_info['base_url'] = publisher.url('/')
+        source_info['rss_feeds'] = [publisher.url('/feed.xml')] if source_info.get('rss_feeds') else []
+        if source_info.get('sitemap_url'):
+            source_info['sitemap_url'] = publisher.url(publisher.sitemap_path())
+    collector.target_sources = {name: collector.target_sources[name] for name in source_names}
+
+    if args.no_throttle:
+        collector.rate_limiter.enabled = False
+
+    timer = StageTimer()
+    timer.wrap(collector, 'collect_from_source', 'discovery')
+    timer.wrap(collector, 'extract_full_content', 'extraction')
+
+    log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(log if not args.verbose else sys.stdout):
+        articles = collector.collect_top_3_per_publication()
+    collection_seconds = time.perf_counter() - start
+
+    summarization_seconds = 0.0
+    summaries = 0
+    if not args.skip_summarize and articles:
+        try:
+            from AgentSumm import ArticleSummarizer
+        except ImportError as e:
+            print(f"⚠️  Summarizer not available ({e}) - skipping summarization stage")
+        else:
+            summarizer = ArticleSummarizer(args.model)
+            timer.wrap(summarizer, 'summarize_article', 'summarization')
+            start = time.perf_counter()
+            for article in articles:
+                if summarizer.summarize_article(article.full_content, article.url, article.publication,
+                                                article.title, article.author):
+                    summaries += 1
+            summarization_seconds = time.perf_counter() - start
+
+    for server in servers:
+        server.shutdown()
+
+    total_seconds = collection_seconds + summarization_seconds
+    return {
+        'publications': len(source_names),
+        'articles_collected': len(articles),
+        'articles_summarized': summaries,
+        'collection_seconds': round(collection_seconds, 2),
+        'summarization_seconds': round(summarization_seconds, 2),
+        'articles_per_minute': round(len(articles) / total_seconds * 60, 1) if total_seconds else 0.0,
+        'stages': {stage: {'seconds': round(seconds, 2), 'calls': calls}
+                   for stage, (seconds, calls) in sorted(timer.totals.items())},
+        'requests_served': sum(p.requests_served for p in publishers.values()),
+        'errors_injected': sum(p.errors_injected for p in publishers.values()),
+        'throttle_wait_seconds': round(collector.rate_limiter.total_wait_time(), 2),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def print_report(results: dict):
+    print("\nBENCHMARK REPORT")
+    print("=" * 60)
+    print(f"Publications:        {results['publications']}")
+    print(f"Articles collected:  {results['articles_collected']}")
+    print(f"Articles summarized: {results['articles_summarized']}")
+    print(f"Collection time:     {results['collection_seconds']:.1f}s")
+    print(f"Summarization time:  {results['summarization_seconds']:.1f}s")
+    print(f"Throughput:          {results['articles_per_minute']:.1f} articles/minute")
+    print(f"Requests served:     {results['requests_served']} ({results['errors_injected']} injected errors)")
+    print(f"Throttled:           {results['throttle_wait_seconds']:.1f}s")
+    print(f"Peak RSS:            {results['peak_rss_mb']:.1f} MB")
+    print("\nPer-stage time (summed across worker threads):")
+    for stage, stats in results['stages'].items():
+        print(f"  {stage:<14} {stats['seconds']:>8.2f}s over {stats['calls']} calls")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline throughput benchmark for the article collector")
+    parser.add_argument('--latency-ms', type=float, default=50, help="Per-request server latency")
+    parser.add_argument('--error-rate', type=float, default=0.05, help="Fraction of article requests answered 403/429")
+    parser.add_argument('--page-kb', type=int, default=12, help="Approximate article page size")
+    parser.add_argument('--articles', type=int, default=40, help="Articles per publication")
+    parser.add_argument('--sources', type=int, default=0, help="Only use the first N publications")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-throttle', action='store_true', help="Disable per-host rate limiting")
+    parser.add_argument('--skip-summarize', action='store_true', help="Skip the BART summarization stage")
+    parser.add_argument('--model', default='facebook/bart-large-cnn', help="Summarization model")
+    parser.add_argument('--warm-cache', action='store_true', help="Keep using the normal on-disk caches")
+    parser.add_argument('--relevance-model', choices=['keywords', 'bm25'], help="Override RELEVANCE_MODEL")
+    parser.add_argument('--verbose', action='store_true', help="Show collector output")
+    parser.add_argument('--json', help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    # Start from empty caches unless asked otherwise (must happen before importing the collector)
+    if not args.warm_cache:
+        os.environ['COLLECTOR_CACHE_DIR'] = tempfile.mkdtemp(prefix='collector-bench-')
+    if args.relevance_model:
+        os.environ['RELEVANCE_MODEL'] = args.relevance_model
+
+    results = run_benchmark(args)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
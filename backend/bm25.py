@@ -0,0 +1,148 @@
+"""
+BM25 Relevance Model
+Frequency- and length-aware alternative to the fixed per-keyword weights: the
+taxonomy keywords are the query (their weights scale each term) and document
+frequencies come from the articles earlier runs fetched, persisted in SQLite.
+Selected per run with RELEVANCE_MODEL=bm25 (default: keywords)
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from http_cache import DEFAULT_CACHE_DIR
+from keyword_taxonomy import KeywordTaxonomy
+from url_utils import normalize_url
+
+RELEVANCE_MODELS = ('keywords', 'bm25')
+DEFAULT_RELEVANCE_MODEL = os.getenv('RELEVANCE_MODEL', 'keywords').lower()
+
+# Until this many articles have been seen every keyword gets the full IDF of 1.0
+MIN_DOCUMENTS = 20
+DEFAULT_AVG_LENGTH = 600
+
+
+class CorpusStats:
+    """
+    Document frequencies of taxonomy keywords over every article fetched so far
+
+    Scoring uses the snapshot loaded at startup; documents added during a run are
+    buffered and written by flush(), so scores don't depend on thread timing.
+    Each article (by normalize_url) is counted once.
+    """
+
+    def __init__(self, cache_dir: str = None, read_only: bool = False):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.read_only = read_only
+        self._pending: Dict[str, Tuple[int, List[str]]] = {}
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, 'bm25_stats.sqlite'), check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                norm_url TEXT PRIMARY KEY,
+                length INTEGER NOT NULL,
+                added_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS df (
+                keyword TEXT PRIMARY KEY,
+                docs INTEGER NOT NULL
+            );
+        """)
+        self._load()
+
+    def _load(self):
+        self.doc_count, total_length = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM documents"
+        ).fetchone()
+        self.avg_length = total_length / self.doc_count if self.doc_count else DEFAULT_AVG_LENGTH
+        self.df = dict(self._db.execute("SELECT keyword, docs FROM df").fetchall())
+
+    def idf(self, keyword: str) -> float:
+        """
+        BM25 IDF scaled to 0..1 by that of a keyword no article contains
+
+        Keeps scores on the scale of the fixed keyword weights, so the collector's
+        thresholds mean the same under either model.
+        """
+        if self.doc_count < MIN_DOCUMENTS:
+            return 1.0
+        df = self.df.get(keyword, 0)
+        max_idf = math.log(1 + (self.doc_count + 0.5) / 0.5)
+        return math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5)) / max_idf
+
+    def add_document(self, url: str, length: int, keywords: List[str]):
+        """Buffer an article's length and distinct keywords for the next flush()"""
+        if self.read_only:
+            return
+        with self._lock:
+            self._pending[normalize_url(url)] = (length, list(dict.fromkeys(keywords)))
+
+    def flush(self) -> int:
+        """Write buffered articles not already counted; returns how many were added"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            added = 0
+            with self._db:
+                for norm_url, (length, keywords) in pending.items():
+                    cursor = self._db.execute(
+                        "INSERT OR IGNORE INTO documents (norm_url, length, added_at) VALUES (?, ?, ?)",
+                        (norm_url, length, time.time())
+                    )
+                    if not cursor.rowcount:
+                        continue
+                    added += 1
+                    self._db.executemany(
+                        "INSERT INTO df (keyword, docs) VALUES (?, 1) "
+                        "ON CONFLICT(keyword) DO UPDATE SET docs = docs + 1",
+                        [(keyword,) for keyword in keywords]
+                    )
+            self._load()
+        return added
+
+    def format_report(self) -> str:
+        with self._lock:
+            pending = len(self._pending)
+        return (f"BM25 corpus: {self.doc_count} articles, avg {self.avg_length:.0f} words"
+                f"{f', {pending} pending' if pending else ''}")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class BM25Scorer:
+    """
+    Okapi BM25 over the taxonomy keywords, weighted by their taxonomy weight
+
+    Returns (score, keywords found) like calculate_relevance_score, with the
+    taxonomy's multi-match bonuses applied, so the existing thresholds still apply:
+    keywords that appear in most articles ('style', 'collection') contribute little,
+    repeated mentions saturate and long articles are normalized by length.
+    """
+
+    def __init__(self, taxonomy: KeywordTaxonomy, stats: CorpusStats, k1: float = 1.2, b: float = 0.75):
+        self.taxonomy = taxonomy
+        self.stats = stats
+        self.k1 = k1
+        self.b = b
+
+    def score(self, text: str) -> Tuple[float, List[str]]:
+        counts = self.taxonomy.matcher.counts(text)
+        length_norm = 1 - self.b + self.b * len(text.split()) / self.stats.avg_length
+
+        score = 0.0
+        for keyword, tf in counts.items():
+            saturation = tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+            score += self.taxonomy.weights[keyword] * self.stats.idf(keyword) * saturation
+
+        for min_matches, multiplier in self.taxonomy.bonuses:
+            if len(counts) >= min_matches:
+                score *= multiplier
+
+        found = [keyword for keyword in self.taxonomy.keywords if keyword in counts]
+        return score, found
@@ -0,0 +1,121 @@
+"""
+Per-Host Circuit Breaker
+Stops hammering hosts that are blocking us (403/429/SSL handshake failures)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+from rate_limiter import host_key
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a request to a host whose circuit is open"""
+
+
+@dataclass
+class CircuitState:
+    consecutive_failures: int = 0
+    trips: int = 0
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+    is_open: bool = False
+    trial_in_flight: bool = False
+    skipped_requests: int = 0
+
+
+class HostCircuitBreaker:
+    """
+    Circuit breaker keyed by host
+
+    After failure_threshold consecutive blocking failures the circuit opens and
+    requests are refused without touching the network. Once the cooldown has passed a
+    single trial request is let through (half-open): success closes the circuit, another
+    failure re-opens it with double the cooldown (base_cooldown * 2**(trips - 1),
+    capped at max_cooldown).
+    """
+
+    def __init__(self, failure_threshold: int = 3, base_cooldown: float = 120.0,
+                 max_cooldown: float = 1800.0):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._states: Dict[str, CircuitState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, url: str) -> CircuitState:
+        key = host_key(url)
+        state = self._states.get(key)
+        if state is None:
+            state = CircuitState()
+            self._states[key] = state
+        return state
+
+    def allow(self, url: str) -> bool:
+        """Whether a request to url's host may go ahead now"""
+        with self._lock:
+            state = self._state(url)
+            if not state.is_open:
+                return True
+
+            cooled_down = time.monotonic() - state.opened_at >= state.cooldown
+            if cooled_down and not state.trial_in_flight:
+                state.trial_in_flight = True
+                return True
+
+            state.skipped_requests += 1
+            return False
+
+    def is_open(self, url: str) -> bool:
+        """True while url's host is blocked and still cooling down"""
+        with self._lock:
+            state = self._state(url)
+            return state.is_open and time.monotonic() - state.opened_at < state.cooldown
+
+    def record_success(self, url: str):
+        with self._lock:
+            state = self._state(url)
+            state.consecutive_failures = 0
+            state.is_open = False
+            state.trial_in_flight = False
+
+    def end_trial(self, url: str):
+        """Give back a half-open trial that was granted but never sent"""
+        with self._lock:
+            self._state(url).trial_in_flight = False
+
+    def record_failure(self, url: str) -> bool:
+        """Count a blocking failure; returns True if this failure opened the circuit"""
+        with self._lock:
+            state = self._state(url)
+            state.consecutive_failures += 1
+
+            half_open_failed = state.is_open and state.trial_in_flight
+            if not half_open_failed and (state.is_open or state.consecutive_failures < self.failure_threshold):
+                return False
+
+            state.trips += 1
+            state.is_open = True
+            state.trial_in_flight = False
+            state.opened_at = time.monotonic()
+            state.cooldown = min(self.base_cooldown * 2 ** (state.trips - 1), self.max_cooldown)
+            return True
+
+    def cooldown_for(self, url: str) -> float:
+        with self._lock:
+            return self._state(url).cooldown
+
+    def format_report(self) -> str:
+        with self._lock:
+            tripped = {key: state for key, state in self._states.items() if state.trips}
+        if not tripped:
+            return "Circuit breaker: no hosts tripped"
+
+        lines = [f"Circuit breaker: {len(tripped)} host(s) tripped"]
+        for key, state in sorted(tripped.items()):
+            status = "open" if state.is_open else "closed"
+            lines.append(f"  {key}: {status}, tripped {state.trips}x, "
+                         f"{state.skipped_requests} requests skipped")
+        return "\n".join(lines)
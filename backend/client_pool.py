@@ -0,0 +1,202 @@
+"""
+Shared HTTP Client Pool
+Per-host keep-alive sessions reused by the collector, relevance checker and summarizer,
+so repeated fetches from one domain skip the TCP/TLS handshake
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Try to import curl-cffi (most powerful anti-blocking)
+try:
+    from curl_cffi import requests as curl_requests
+    CURL_CFFI_AVAILABLE = True
+except ImportError:
+    CURL_CFFI_AVAILABLE = False
+
+try:
+    from curl_cffi import CurlHttpVersion
+    HTTP2_VERSION = CurlHttpVersion.V2TLS
+except ImportError:
+    HTTP2_VERSION = None
+
+# Try to import cloudscraper (fallback)
+try:
+    import cloudscraper
+    CLOUDSCRAPER_AVAILABLE = True
+except ImportError:
+    CLOUDSCRAPER_AVAILABLE = False
+
+
+class _HostSessions:
+    """Bounded set of sessions for one host; idle ones wait in a LIFO queue"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.created = 0
+        self.idle = LifoQueue()
+        self.lock = threading.Lock()
+
+
+class ClientPool:
+    """
+    Pool of scraper sessions keyed by host
+
+    Each host gets up to max_sessions_per_host sessions. Reusing a session keeps its
+    connections alive: curl-cffi handles also keep their TLS session cache (so
+    reconnects resume instead of doing a full handshake) and negotiate HTTP/2.
+    Requests-based sessions keep their urllib3 connection pool. When more than
+    max_hosts hosts have sessions, idle sessions of the least recently used host
+    are closed.
+    """
+
+    def __init__(self, max_sessions_per_host: int = 2, max_hosts: int = 48,
+                 impersonate: str = "chrome110"):
+        self.max_sessions_per_host = max_sessions_per_host
+        self.max_hosts = max_hosts
+        self.impersonate = impersonate
+
+        if CURL_CFFI_AVAILABLE:
+            self.scraper_type = 'curl-cffi'
+        elif CLOUDSCRAPER_AVAILABLE:
+            self.scraper_type = 'cloudscraper'
+        else:
+            self.scraper_type = 'requests'
+
+        self.requests_made = 0
+        self.sessions_created = 0
+        self._hosts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _create_session(self):
+        if self.scraper_type == 'curl-cffi':
+            kwargs = {'impersonate': self.impersonate}
+            if HTTP2_VERSION is not None:
+                kwargs['http_version'] = HTTP2_VERSION
+            try:
+                return curl_requests.Session(**kwargs)
+            except TypeError:
+                return curl_requests.Session()
+
+        if self.scraper_type == 'cloudscraper':
+            session = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'mobile': False
+                }
+            )
+            # Keep cloudscraper's CipherSuiteAdapter (its TLS fingerprint is the point
+            # of using it) and only resize its connection pool
+            for adapter in set(session.adapters.values()):
+                self._resize_adapter(adapter)
+            return session
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_sessions_per_host)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _resize_adapter(self, adapter):
+        if not isinstance(adapter, HTTPAdapter):
+            return
+        adapter._pool_connections = 1
+        adapter._pool_maxsize = self.max_sessions_per_host
+        # Goes through the adapter's own init_poolmanager, so subclasses keep their SSL context
+        adapter.init_poolmanager(1, self.max_sessions_per_host, block=adapter._pool_block)
+
+    def _host_sessions(self, host: str) -> _HostSessions:
+        with self._lock:
+            host_sessions = self._hosts.get(host)
+            if host_sessions is None:
+                host_sessions = _HostSessions(self.max_sessions_per_host)
+                self._hosts[host] = host_sessions
+            self._hosts.move_to_end(host)
+
+            while len(self._hosts) > self.max_hosts:
+                _, evicted = self._hosts.popitem(last=False)
+                self._close_idle(evicted)
+
+            return host_sessions
+
+    def _close_idle(self, host_sessions: _HostSessions):
+        while True:
+            try:
+                session = host_sessions.idle.get_nowait()
+            except Empty:
+                return
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def session(self, url: str):
+        """Check out a session for url's host, blocking if the host's sessions are all busy"""
+        host_sessions = self._host_sessions(urlparse(url).netloc.lower())
+
+        session = None
+        try:
+            session = host_sessions.idle.get_nowait()
+        except Empty:
+            with host_sessions.lock:
+                if host_sessions.created < host_sessions.max_size:
+                    # Only count sessions that exist, or a failing constructor would use
+                    # up the host's slots and leave later requests waiting forever
+                    session = self._create_session()
+                    host_sessions.created += 1
+                    with self._lock:
+                        self.sessions_created += 1
+        if session is None:
+            session = host_sessions.idle.get()
+
+        try:
+            yield session
+        finally:
+            host_sessions.idle.put(session)
+
+    def get(self, url: str, headers: dict = None, timeout: int = 10, verify: bool = True):
+        """GET url on a pooled session for its host"""
+        with self._lock:
+            self.requests_made += 1
+
+        with self.session(url) as session:
+            if self.scraper_type == 'curl-cffi':
+                return session.get(
+                    url,
+                    headers=headers,
+                    timeout=timeout,
+                    impersonate=self.impersonate,
+                    verify=verify
+                )
+            return session.get(url, headers=headers, timeout=timeout, verify=verify)
+
+    def format_report(self) -> str:
+        return (f"Client pool: {self.requests_made} requests over {self.sessions_created} sessions "
+                f"({len(self._hosts)} hosts, {self.scraper_type})")
+
+    def close(self):
+        with self._lock:
+            for host_sessions in self._hosts.values():
+                self._close_idle(host_sessions)
+            self._hosts.clear()
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_client_pool() -> ClientPool:
+    """Process-wide ClientPool shared by every entry point"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ClientPool()
+        return _default_pool
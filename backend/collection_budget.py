@@ -0,0 +1,143 @@
+"""
+Collection Budget Scheduler
+Global deadline plus per-source request/time budgets, so collection stops in time
+to leave room for summarization and PDF generation
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+class BudgetExhausted(Exception):
+    """Raised instead of making a request once the collection budget is spent"""
+
+
+@dataclass
+class SourceUsage:
+    requests: int = 0
+    started: float = field(default_factory=time.monotonic)
+    exhausted_reason: Optional[str] = None
+    paused_at: Optional[float] = None
+
+
+class CollectionBudget:
+    """
+    Time and request budget for one collection run
+
+    The collection deadline is not fixed: every article collected reserves
+    seconds_per_article of the remaining time for its summarization, on top of
+    reserve_seconds for saving and PDF generation. Each source may also make at most
+    source_max_requests requests and run for at most source_max_seconds.
+
+    The source being collected is tracked per thread (see begin_source), so
+    make_request can charge the right source without being told which one it is.
+    """
+
+    def __init__(self, total_seconds: float, reserve_seconds: float = 180.0,
+                 seconds_per_article: float = 45.0, source_max_requests: int = 40,
+                 source_max_seconds: Optional[float] = None):
+        self.started = time.monotonic()
+        self.total_seconds = total_seconds
+        self.reserve_seconds = reserve_seconds
+        self.seconds_per_article = seconds_per_article
+        self.source_max_requests = source_max_requests
+        self.source_max_seconds = source_max_seconds
+
+        self.articles_collected = 0
+        self.requests_refused = 0
+        self._sources: Dict[str, SourceUsage] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def deadline(self) -> float:
+        """time.monotonic() value after which no more collection requests are made"""
+        reserved = self.reserve_seconds + self.seconds_per_article * self.articles_collected
+        return self.started + self.total_seconds - reserved
+
+    def remaining(self) -> float:
+        return self.deadline() - time.monotonic()
+
+    def pipeline_remaining(self) -> float:
+        """Seconds left before the whole pipeline's time limit"""
+        return self.started + self.total_seconds - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def begin_source(self, publication: str):
+        """Mark the calling thread as collecting publication"""
+        with self._lock:
+            self._sources[publication] = SourceUsage()
+        self._local.publication = publication
+
+    def join_source(self, publication: str):
+        """Charge the calling helper thread's requests to publication's existing budget"""
+        self._local.publication = publication
+
+    def pause_source(self, publication: str):
+        """Stop publication's time budget while it waits (e.g. between discovery and extraction)"""
+        with self._lock:
+            usage = self._sources.get(publication)
+            if usage is not None and usage.paused_at is None:
+                usage.paused_at = time.monotonic()
+
+    def resume_source(self, publication: str):
+        """Like join_source, restarting a paused publication's time budget"""
+        self._local.publication = publication
+        with self._lock:
+            usage = self._sources.get(publication)
+            if usage is not None and usage.paused_at is not None:
+                usage.started += time.monotonic() - usage.paused_at
+                usage.paused_at = None
+
+    def current_source(self) -> Optional[str]:
+        return getattr(self._local, 'publication', None)
+
+    def record_articles(self, count: int):
+        """Reserve summarization time for newly collected articles"""
+        with self._lock:
+            self.articles_collected += count
+
+    def exhausted_reason(self, publication: str = None) -> Optional[str]:
+        """Why collection for publication (default: this thread's source) must stop, if it must"""
+        if self.expired():
+            return "collection deadline reached"
+
+        publication = publication or self.current_source()
+        with self._lock:
+            usage = self._sources.get(publication)
+            if usage is None:
+                return None
+            if usage.requests >= self.source_max_requests:
+                usage.exhausted_reason = f"request budget ({self.source_max_requests}) spent"
+            elif self.source_max_seconds and time.monotonic() - usage.started >= self.source_max_seconds:
+                usage.exhausted_reason = f"time budget ({self.source_max_seconds:.0f}s) spent"
+            return usage.exhausted_reason
+
+    def charge(self):
+        """Account for one request by this thread's source, or raise BudgetExhausted"""
+        reason = self.exhausted_reason()
+        if reason:
+            with self._lock:
+                self.requests_refused += 1
+            raise BudgetExhausted(f"Budget exhausted: {reason}")
+
+        publication = self.current_source()
+        with self._lock:
+            usage = self._sources.get(publication)
+            if usage is not None:
+                usage.requests += 1
+
+    def format_report(self) -> str:
+        elapsed = time.monotonic() - self.started
+        with self._lock:
+            stopped = {pub: usage.exhausted_reason for pub, usage in self._sources.items()
+                       if usage.exhausted_reason}
+        lines = [f"Budget: collection took {elapsed:.0f}s, {self.articles_collected} articles reserve "
+                 f"{self.seconds_per_article * self.articles_collected:.0f}s for summarization, "
+                 f"{self.requests_refused} requests refused"]
+        for pub, reason in sorted(stopped.items()):
+            lines.append(f"  {pub}: stopped early ({reason})")
+        return "\n".join(lines)
@@ -0,0 +1,33 @@
+"""
+Feed Parsing
+feedparser entries reduced to the JSON-serialisable dicts the collector works with
+(and caches alongside the conditional-GET entry of each feed)
+"""
+
+from datetime import datetime
+from typing import List
+
+import feedparser
+
+
+def feed_entry_to_dict(entry) -> dict:
+    """Reduce a feedparser entry to the JSON-serialisable fields we use"""
+    published = None
+    try:
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            published = datetime(*entry.published_parsed[:6]).isoformat()
+    except (TypeError, ValueError):
+        pass
+
+    return {
+        'title': entry.get('title', '').strip(),
+        'summary': entry.get('summary', '').strip(),
+        'link': entry.get('link', '').strip(),
+        'published': published
+    }
+
+
+def parse_feed_entries(content: bytes) -> List[dict]:
+    """Parse a feed document into entry dicts"""
+    feed = feedparser.parse(content)
+    return [feed_entry_to_dict(entry) for entry in getattr(feed, 'entries', [])]
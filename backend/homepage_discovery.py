@@ -0,0 +1,97 @@
+"""
+Homepage / Section Link Discovery
+Third discovery tier after sitemaps and RSS: article links and their anchor text
+are pulled from a publication's base_url page with lxml
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from lxml import etree, html as lxml_html
+
+# Common article-link patterns (XPath equivalents of the CSS selectors in the old
+# homepage scraper); a source can replace them with 'link_selectors' in target_sources
+DEFAULT_LINK_SELECTORS = [
+    '//a[contains(@href, "/article")]',
+    '//a[contains(@href, "/news")]',
+    '//a[contains(@href, "/fashion")]',
+    '//a[contains(@href, "/style")]',
+    '//a[contains(@href, "/jewel")]',
+    '//a[contains(@href, "/luxury")]',
+    '//*[contains(@class, "article-link")]//a',
+    '//h2//a', '//h3//a',
+    '//*[contains(@class, "headline")]//a',
+    '//*[contains(@class, "article")]//a',
+]
+
+
+def _site_host(url: str) -> str:
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def _looks_like_article(url: str, base_url: str) -> bool:
+    """Skip section fronts, tag pages and other navigation links"""
+    path = urlsplit(url).path.rstrip('/')
+    if not path or url.rstrip('/') == base_url.rstrip('/'):
+        return False
+    slug = path.rsplit('/', 1)[-1]
+    return path.count('/') >= 2 or (slug.count('-') >= 3 and len(slug) >= 20)
+
+
+class HomepageDiscovery:
+    """
+    Extracts (url, anchor text) pairs from section pages
+
+    Each publication's selectors are combined into one XPath union and compiled the
+    first time the publication is seen, so every page is scanned in a single pass.
+    Only links on the publication's own site are kept.
+    """
+
+    def __init__(self, max_links: int = 60):
+        self.max_links = max_links
+        self._compiled: Dict[str, etree.XPath] = {}
+        self._lock = threading.Lock()
+
+    def _selector_for(self, publication: str, selectors: Optional[List[str]]) -> etree.XPath:
+        with self._lock:
+            compiled = self._compiled.get(publication)
+            if compiled is None:
+                compiled = etree.XPath(" | ".join(selectors or DEFAULT_LINK_SELECTORS))
+                self._compiled[publication] = compiled
+            return compiled
+
+    def extract_links(self, publication: str, base_url: str, content: bytes,
+                      selectors: List[str] = None) -> List[Tuple[str, str]]:
+        """Article links on the page at base_url, with their anchor text, in page order"""
+        try:
+            document = lxml_html.fromstring(content, base_url=base_url)
+        except (etree.ParserError, ValueError):
+            return []
+        document.make_links_absolute(base_url, resolve_base_href=True)
+
+        site = _site_host(base_url)
+        links: Dict[str, str] = {}
+        for anchor in self._selector_for(publication, selectors)(document):
+            href = (anchor.get('href') or '').split('#')[0]
+            if not href.startswith('http') or _site_host(href) != site:
+                continue
+            if not _looks_like_article(href, base_url):
+                continue
+
+            text = " ".join(anchor.text_content().split()) or anchor.get('title') or anchor.get('aria-label') or ""
+            # Image links often come first with no text; keep the longest anchor text seen
+            if len(text) > len(links.get(href, "")):
+                links[href] = text
+            elif href not in links:
+                links[href] = ""
+
+            if len(links) >= self.max_links:
+                break
+
+        return list(links.items())
+
+    def clear(self):
+        with self._lock:
+            self._compiled.clear()
@@ -0,0 +1,163 @@
+"""
+Article HTML Cache
+Content-addressed store of compressed article pages, shared by the collector,
+the relevance checker and the summarizer so pages we already have never hit the network
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+from http_cache import DEFAULT_CACHE_DIR, CachedResponse
+
+
+class HTMLCache:
+    """
+    URL -> page HTML, stored by content hash
+
+    Bodies live under objects/<aa>/<sha256>.z (zlib-compressed); an SQLite index maps
+    each URL to its digest with fetch and access times. Entries older than ttl_seconds
+    are treated as misses, and the least recently used pages are evicted once the
+    stored bytes exceed max_bytes. Identical pages reached through different URLs
+    share one object.
+    """
+
+    def __init__(self, cache_dir: str = None, ttl_seconds: float = 7 * 24 * 3600,
+                 max_bytes: int = 200 * 1024 * 1024):
+        self.cache_dir = os.path.join(cache_dir or DEFAULT_CACHE_DIR, 'html')
+        self.objects_dir = os.path.join(self.cache_dir, 'objects')
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, 'index.sqlite'), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access)")
+        self._db.commit()
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.z")
+
+    def get(self, url: str) -> Optional[str]:
+        """Cached HTML for url, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            digest = row[0]
+            try:
+                with open(self._object_path(digest), 'rb') as f:
+                    html = zlib.decompress(f.read()).decode('utf-8')
+            except (OSError, zlib.error, UnicodeDecodeError):
+                self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                self._db.commit()
+                self.misses += 1
+                return None
+
+            self._db.execute("UPDATE pages SET last_access = ? WHERE url = ?", (now, url))
+            self._db.commit()
+            self.hits += 1
+            return html
+
+    def get_response(self, url: str) -> Optional[CachedResponse]:
+        """Cached page wrapped as a 200 response, for callers that expect one"""
+        html = self.get(url)
+        if html is None:
+            return None
+        return CachedResponse(url, 200, html.encode('utf-8'), {'Content-Type': 'text/html; charset=utf-8'})
+
+    def put(self, url: str, html: str):
+        """Store the HTML fetched for url"""
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        now = time.time()
+
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(zlib.compress(data, 6))
+                os.replace(tmp_path, path)
+
+            previous = self._db.execute("SELECT digest FROM pages WHERE url = ?", (url,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (url, digest, size, fetched_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (url, digest, os.path.getsize(path), now, now)
+            )
+
+            dropped = {previous[0]} if previous and previous[0] != digest else set()
+            dropped |= self._evict_locked(now)
+            self._db.commit()
+            self._remove_orphans_locked(dropped)
+
+    def _evict_locked(self, now: float) -> set:
+        """Drop expired entries, then least recently used ones until under max_bytes"""
+        dropped = set()
+
+        for url, digest in self._db.execute(
+            "SELECT url, digest FROM pages WHERE fetched_at < ?", (now - self.ttl_seconds,)
+        ).fetchall():
+            self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+            dropped.add(digest)
+
+        # Shared objects are counted once per URL, which errs on the side of evicting early
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total > self.max_bytes:
+            for url, digest, size in self._db.execute(
+                "SELECT url, digest, size FROM pages ORDER BY last_access"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                dropped.add(digest)
+                total -= size
+
+        return dropped
+
+    def _remove_orphans_locked(self, digests: set):
+        """Delete object files that no URL references any more"""
+        for digest in digests:
+            still_used = self._db.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+            if still_used is None:
+                try:
+                    os.remove(self._object_path(digest))
+                except OSError:
+                    pass
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_html_cache() -> HTMLCache:
+    """Process-wide HTMLCache so every entry point shares one index connection"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HTMLCache()
+        return _default_cache
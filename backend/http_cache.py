@@ -0,0 +1,156 @@
+"""
+HTTP Conditional-GET Cache
+Persists sitemap/RSS bodies with their ETag/Last-Modified validators so unchanged
+documents come back as 304s and are served (and their parsed form reused) from disk
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_DIR = os.getenv('COLLECTOR_CACHE_DIR', 'cache')
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for a requests/curl-cffi response served from disk
+    Exposes the attributes the collectors use: status_code, content, text, headers, url
+    """
+
+    def __init__(self, url: str, status_code: int, content: bytes, headers: Dict[str, str] = None,
+                 from_cache: bool = True, not_modified: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.from_cache = from_cache
+        self.not_modified = not_modified
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 400
+
+    @property
+    def encoding(self) -> Optional[str]:
+        match = re.search(r'charset=([\w.:-]+)', self.headers.get('Content-Type', ''), re.IGNORECASE)
+        return match.group(1) if match else None
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding or 'utf-8')
+        except (UnicodeDecodeError, LookupError):
+            return self.content.decode('iso-8859-1')
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise Exception(f"HTTP {self.status_code} error for {self.url}")
+
+
+class HTTPCache:
+    """
+    On-disk cache of validated HTTP responses, one entry per URL
+
+    Each entry is three files named by the URL hash: <key>.json (validators and
+    headers), <key>.body (raw bytes) and optionally <key>.parsed.json (whatever the
+    caller derived from the body, invalidated whenever a new body is stored).
+    """
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = os.path.join(cache_dir or DEFAULT_CACHE_DIR, 'http')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stored = 0
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+
+    def _write(self, path: str, data: bytes):
+        """Atomic write so concurrent readers never see a partial file"""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _load_meta(self, url: str) -> Optional[dict]:
+        try:
+            with open(self._path(url, '.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers for a conditional GET, empty if nothing usable is cached"""
+        meta = self._load_meta(url)
+        if not meta or not os.path.exists(self._path(url, '.body')):
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load(self, url: str) -> Optional[CachedResponse]:
+        """Serve a cached body after the server answered 304 Not Modified"""
+        meta = self._load_meta(url)
+        try:
+            with open(self._path(url, '.body'), 'rb') as f:
+                content = f.read()
+        except OSError:
+            content = None
+
+        if meta is None or content is None:
+            return None
+
+        with self._lock:
+            self.hits += 1
+
+        return CachedResponse(url, 200, content, meta.get('headers'), from_cache=True, not_modified=True)
+
+    def store(self, url: str, response):
+        """Store a 200 response if it carries validators we can revalidate with later"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': datetime.now().isoformat(),
+            'headers': {'Content-Type': response.headers.get('Content-Type', '')}
+        }
+
+        with self._lock:
+            self.stored += 1
+            try:
+                os.remove(self._path(url, '.parsed.json'))
+            except OSError:
+                pass
+            self._write(self._path(url, '.body'), response.content)
+            self._write(self._path(url, '.json'), json.dumps(meta).encode('utf-8'))
+
+    def get_parsed(self, url: str):
+        """Parsed form of the cached body, or None if it was never stored"""
+        try:
+            with open(self._path(url, '.parsed.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store_parsed(self, url: str, data):
+        """Remember what the caller parsed out of the cached body"""
+        if not os.path.exists(self._path(url, '.json')):
+            return
+        self._write(self._path(url, '.parsed.json'), json.dumps(data).encode('utf-8'))
@@ -0,0 +1,160 @@
+"""
+HTTP Cassette (WARC-backed record/replay)
+Records every response the collector sees into a .warc.gz archive and replays them
+offline with no network access and no politeness delays, for reproducible profiling
+"""
+
+import gzip
+import json
+import mmap
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.client import responses as HTTP_REASONS
+from typing import Dict, Optional, Tuple
+
+from http_cache import CachedResponse
+
+# Headers describing the wire encoding; bodies are stored decoded
+_HOP_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+
+class CassetteMiss(Exception):
+    """Raised during replay for a URL that was never recorded"""
+
+
+class HTTPCassette:
+    """
+    Record/replay store for HTTP responses
+
+    Each response is written as one gzip member holding a WARC/1.1 'response' record,
+    so the archive can be opened with standard WARC tools. A sidecar CDXJ-style index
+    (<archive>.cdxj: '<url> {"offset": ..., "length": ..., "status": ...}') maps URLs to
+    byte ranges; replay memory-maps the archive and decompresses only the record asked
+    for. When a URL was recorded more than once, the last record wins.
+    """
+
+    def __init__(self, path: str, mode: str = 'replay'):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', not {mode!r}")
+
+        self.path = path
+        self.index_path = f"{path}.cdxj"
+        self.mode = mode
+        self.records = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._archive = None
+        self._index_file = None
+        self._mmap = None
+
+        if mode == 'record':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._archive = open(path, 'ab')
+            self._index_file = open(self.index_path, 'a', encoding='utf-8')
+        else:
+            self._open_for_replay()
+
+    @classmethod
+    def from_spec(cls, spec: str) -> 'HTTPCassette':
+        """Build a cassette from 'record:<path>' or 'replay:<path>'"""
+        mode, _, path = spec.partition(':')
+        if not path:
+            raise ValueError(f"Cassette spec must look like 'record:<path>' or 'replay:<path>', got {spec!r}")
+        return cls(path, mode)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    def _open_for_replay(self):
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                url, _, meta = line.rstrip('\n').partition(' ')
+                if url and meta:
+                    entry = json.loads(meta)
+                    self._index[url] = (entry['offset'], entry['length'])
+
+        with open(self.path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def record(self, url: str, response):
+        """Append response to the archive (record mode only)"""
+        if not self.recording:
+            return
+
+        body = response.content or b''
+        reason = HTTP_REASONS.get(response.status_code, '')
+        header_lines = [f"HTTP/1.1 {response.status_code} {reason}"]
+        for name, value in response.headers.items():
+            if name.lower() not in _HOP_HEADERS:
+                header_lines.append(f"{name}: {value}")
+        header_lines.append(f"Content-Length: {len(body)}")
+        http_block = ("\r\n".join(header_lines) + "\r\n\r\n").encode('utf-8', 'replace') + body
+
+        warc_headers = "\r\n".join([
+            "WARC/1.1",
+            "WARC-Type: response",
+            f"WARC-Target-URI: {url}",
+            f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+            "Content-Type: application/http; msgtype=response",
+            f"Content-Length: {len(http_block)}",
+        ]) + "\r\n\r\n"
+        member = gzip.compress(warc_headers.encode('utf-8') + http_block + b"\r\n\r\n")
+
+        with self._lock:
+            offset = self._archive.tell()
+            self._archive.write(member)
+            self._archive.flush()
+            entry = {'offset': offset, 'length': len(member), 'status': response.status_code}
+            self._index_file.write(f"{url} {json.dumps(entry)}\n")
+            self._index_file.flush()
+            self._index[url] = (offset, len(member))
+            self.records += 1
+
+    def replay(self, url: str) -> CachedResponse:
+        """Serve the recorded response for url, or raise CassetteMiss"""
+        location = self._index.get(url)
+        if location is None or self._mmap is None:
+            with self._lock:
+                self.misses += 1
+            raise CassetteMiss(f"No recorded response for {url}")
+
+        offset, length = location
+        record = gzip.decompress(self._mmap[offset:offset + length])
+
+        # Skip the WARC header block, then split the HTTP header block from the body
+        _, _, http_block = record.partition(b"\r\n\r\n")
+        http_headers, _, body = http_block.partition(b"\r\n\r\n")
+
+        lines = http_headers.decode('utf-8', 'replace').split("\r\n")
+        status_code = int(lines[0].split(' ')[1])
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip()] = value.strip()
+
+        body = body[:int(headers.pop('Content-Length', len(body)))]
+
+        return CachedResponse(url, status_code, body, headers, from_cache=True)
+
+    def close(self):
+        with self._lock:
+            for handle in (self._archive, self._index_file, self._mmap):
+                if handle is not None:
+                    handle.close()
+            self._archive = self._index_file = self._mmap = None
+
+
+def load_cassette_from_env() -> Optional[HTTPCassette]:
+    """Cassette configured by COLLECTOR_CASSETTE ('record:<path>' or 'replay:<path>'), if any"""
+    spec = os.getenv('COLLECTOR_CASSETTE')
+    return HTTPCassette.from_spec(spec) if spec else None
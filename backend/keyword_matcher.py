@@ -0,0 +1,118 @@
+"""
+Compiled Keyword Matcher
+All relevance keywords are found in one regex pass over the text, on word
+boundaries, with weights looked up in a precomputed dict
+"""
+
+import re
+from typing import Dict, Iterable, List
+
+
+def _keyword_pattern(keyword: str) -> str:
+    # Multi-word keywords match across any run of whitespace
+    return r'\s+'.join(re.escape(word) for word in keyword.lower().split())
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Alternation of keywords with common prefixes factored out
+
+    A flat 'a|b|c...' makes the regex engine try every keyword at every word start;
+    as a trie each start costs a character or two. Longer keywords are still tried
+    before their prefixes.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for word_index, word in enumerate(keyword.lower().split()):
+            if word_index:
+                node = node.setdefault(' ', {})
+            for char in word:
+                node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: dict) -> str:
+        branches = []
+        for char in sorted((c for c in node if c), key=lambda c: -_depth(node[c])):
+            branches.append((r'\s+' if char == ' ' else re.escape(char)) + build(node[char]))
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return build(trie)
+
+
+def _depth(node: dict) -> int:
+    return 1 + max((_depth(child) for child in node.values()), default=0)
+
+
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of keywords occur in a text
+
+    Keywords match case-insensitively on word boundaries, with an optional plural
+    ending ('diamond' matches 'diamonds', but 'king' no longer matches 'making').
+    The pattern is a prefix trie tried longest first, so a phrase like 'crown jewels' wins
+    over 'crown'; the keywords contained in a matched phrase are credited too, as
+    the old substring scan did.
+    """
+
+    def __init__(self, keywords: Iterable[str], weights: Dict[str, float] = None,
+                 default_weight: float = 1.0):
+        self.keywords: List[str] = []
+        for keyword in keywords:
+            if keyword.lower() not in (k.lower() for k in self.keywords):
+                self.keywords.append(keyword)
+
+        self._by_lower = {keyword.lower(): keyword for keyword in self.keywords}
+        self._order = {keyword.lower(): position for position, keyword in enumerate(self.keywords)}
+        self.weights = {keyword.lower(): default_weight for keyword in self.keywords}
+        self.weights.update({keyword.lower(): weight for keyword, weight in (weights or {}).items()
+                             if keyword.lower() in self.weights})
+
+        patterns = {keyword: _keyword_pattern(keyword) for keyword in self._by_lower}
+        self._regex = re.compile(rf"\b{_trie_pattern(self._by_lower)}(?:e?s)?\b")
+
+        # Keywords that occur inside a longer keyword ('royal' in 'royal family')
+        self._implied: Dict[str, List[str]] = {}
+        for keyword in self._by_lower:
+            self._implied[keyword] = [
+                other for other in self._by_lower
+                if other != keyword and re.search(rf"\b{patterns[other]}(?:e?s)?\b", keyword)
+            ]
+
+    def _canonical(self, matched: str) -> str:
+        text = " ".join(matched.split())
+        if text in self._by_lower:
+            return text
+        for suffix in ('es', 's'):
+            if text.endswith(suffix) and text[:-len(suffix)] in self._by_lower:
+                return text[:-len(suffix)]
+        return text
+
+    def find(self, text: str) -> List[str]:
+        """Distinct keywords occurring in text, in keyword-list order"""
+        found = set()
+        # Lowercasing up front is much cheaper than a case-insensitive regex
+        for match in self._regex.finditer(text.lower()):
+            keyword = self._canonical(match.group(0))
+            if keyword in found or keyword not in self._by_lower:
+                continue
+            found.add(keyword)
+            found.update(self._implied[keyword])
+        return [self._by_lower[keyword] for keyword in sorted(found, key=self._order.get)]
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Number of occurrences of each keyword found in text (for frequency-based scoring)"""
+        counts: Dict[str, int] = {}
+        for match in self._regex.finditer(text.lower()):
+            keyword = self._canonical(match.group(0))
+            if keyword not in self._by_lower:
+                continue
+            for credited in [keyword] + self._implied[keyword]:
+                counts[self._by_lower[credited]] = counts.get(self._by_lower[credited], 0) + 1
+        return counts
+
+    def weight(self, keyword: str) -> float:
+        return self.weights[keyword.lower()]
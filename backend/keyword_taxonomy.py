@@ -0,0 +1,110 @@
+"""
+Keyword Taxonomy
+Relevance keywords, their categories and weights live in a versioned JSON file
+(keywords.json next to this module, or COLLECTOR_KEYWORDS) that is loaded and
+compiled once into lookup tables
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from keyword_matcher import KeywordMatcher
+
+DEFAULT_TAXONOMY_PATH = os.getenv(
+    'COLLECTOR_KEYWORDS', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keywords.json')
+)
+SUPPORTED_VERSIONS = {1}
+
+
+class TaxonomyError(ValueError):
+    """Raised when a taxonomy file is missing, malformed or of an unknown version"""
+
+
+@dataclass
+class KeywordTaxonomy:
+    version: int
+    keywords: List[str]
+    weights: Dict[str, float]
+    categories: Dict[str, str]
+    bonuses: List[Tuple[int, float]]
+    content_hash: str
+    source: str = ""
+    topics: Dict[str, List[str]] = field(default_factory=dict)
+    matcher: KeywordMatcher = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.matcher = KeywordMatcher(self.keywords, self.weights)
+
+    def score(self, text: str) -> Tuple[float, List[str]]:
+        """Weighted keyword score of text and the keywords found in it"""
+        found = self.matcher.find(text)
+        score = sum(self.weights[keyword] for keyword in found)
+        for min_matches, multiplier in self.bonuses:
+            if len(found) >= min_matches:
+                score *= multiplier
+        return score, found
+
+    @property
+    def cache_key(self) -> str:
+        """Identifies the scoring rules; stored alongside anything derived from scores"""
+        return f"v{self.version}:{self.content_hash}"
+
+
+def _normalize(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def parse_taxonomy(data: dict, source: str = "") -> KeywordTaxonomy:
+    """Build the lookup tables from a decoded taxonomy document"""
+    if not isinstance(data, dict) or data.get('version') not in SUPPORTED_VERSIONS:
+        raise TaxonomyError(f"Unsupported taxonomy version in {source or 'document'}: "
+                            f"{data.get('version') if isinstance(data, dict) else None!r}")
+
+    default_weight = float(data.get('default_weight', 1.0))
+    keywords, weights, categories = [], {}, {}
+    for category, spec in (data.get('categories') or {}).items():
+        if isinstance(spec, list):
+            spec = {'keywords': spec}
+        weight = float(spec.get('weight', default_weight))
+        for keyword in spec.get('keywords', []):
+            keyword = _normalize(keyword)
+            if not keyword:
+                continue
+            if keyword in categories:
+                raise TaxonomyError(f"Keyword {keyword!r} is listed under both "
+                                    f"{categories[keyword]!r} and {category!r}")
+            keywords.append(keyword)
+            weights[keyword] = weight
+            categories[keyword] = category
+
+    if not keywords:
+        raise TaxonomyError(f"Taxonomy {source or 'document'} defines no keywords")
+
+    bonuses = sorted((int(bonus['min_matches']), float(bonus['multiplier']))
+                     for bonus in data.get('bonuses', []))
+
+    # Prototype sentences per topic, for the optional semantic relevance stage
+    topics = {topic: [text for text in prototypes if text.strip()]
+              for topic, prototypes in (data.get('topics') or {}).items()}
+    topics = {topic: prototypes for topic, prototypes in topics.items() if prototypes}
+
+    # Hash the compiled scoring tables rather than the file, so formatting,
+    # descriptions and topics don't change the key
+    canonical = json.dumps({'keywords': weights, 'categories': categories, 'bonuses': bonuses},
+                           sort_keys=True, separators=(',', ':'))
+    content_hash = hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+    return KeywordTaxonomy(data['version'], keywords, weights, categories, bonuses, content_hash, source, topics)
+
+
+def load_taxonomy(path: str = None) -> KeywordTaxonomy:
+    path = path or DEFAULT_TAXONOMY_PATH
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise TaxonomyError(f"Could not load keyword taxonomy {path}: {e}") from e
+    return parse_taxonomy(data, path)
@@ -5,8 +5,14 @@ Integrates AgentCollector, AgentSumm, Google Sheets storage, and PDF generation
 
 import os
 import sys
+import time
 from datetime import datetime
 from google_storage import GoogleSheetsDB
+from collection_budget import CollectionBudget
+
+# Time budgets are measured from process start (model loading counts against the limit),
+# or from JOB_STARTED_AT (epoch seconds) when the CI job records when it began
+PROCESS_START = time.monotonic()
 
 # Import your existing agents
 try:
@@ -51,6 +57,33 @@ class PipelineRunner:
         
         print("\n✅ Pipeline initialized successfully\n")
     
+    def create_collection_budget(self):
+        """
+        Budget the collection phase against the workflow's time limit,
+        reserving time to summarize whatever gets collected
+        """
+        timeout_minutes = float(os.getenv('PIPELINE_TIMEOUT_MINUTES', '55'))
+        seconds_per_summary = float(os.getenv('SECONDS_PER_SUMMARY', '45'))
+        # One slow or stalling publication must not eat the whole run's deadline
+        source_max_seconds = float(os.getenv('SOURCE_MAX_SECONDS', '180'))
+        elapsed = time.monotonic() - PROCESS_START
+        job_started_at = os.getenv('JOB_STARTED_AT')
+        if job_started_at:
+            # Checkout, cache restore and pip install ran before this process started
+            elapsed = max(elapsed, time.time() - float(job_started_at))
+        
+        budget = CollectionBudget(
+            total_seconds=timeout_minutes * 60 - elapsed,
+            reserve_seconds=180,
+            seconds_per_article=seconds_per_summary,
+            source_max_requests=40,
+            source_max_seconds=source_max_seconds
+        )
+        print(f"⏳ Time budget: {budget.total_seconds / 60:.1f} minutes left "
+              f"({seconds_per_summary:.0f}s reserved per collected article, "
+              f"{source_max_seconds:.0f}s max per publication)\n")
+        return budget
+    
     def run_collection(self):
         """
         Collect top 3 articles from each publication
@@ -60,6 +93,7 @@ class PipelineRunner:
         print("="*60 + "\n")
         
         try:
+            self.collector.budget = self.create_collection_budget()
             articles = self.collector.collect_top_3_per_publication()
             
             if not articles:
@@ -107,7 +141,14 @@ class PipelineRunner:
         
         summarized_articles = []
         
+        budget = self.collector.budget
+        
         for idx, article in enumerate(articles_data):
+            # Keep enough time to save results and build the PDF
+            if budget is not None and budget.pipeline_remaining() < budget.reserve_seconds:
+                print(f"⚠️  Time budget reached - skipping remaining {len(articles_data) - idx} articles")
+                break
+            
             print(f"[{idx+1}/{len(articles_data)}] Processing: {article['title'][:60]}...")
             
             try:
@@ -0,0 +1,148 @@
+"""
+Per-Host Rate Limiter
+Token buckets keyed by host, so throttling one publication never delays another
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+@dataclass
+class RateLimitConfig:
+    rate: float = 0.4        # Tokens refilled per second (sustained requests/second)
+    burst: int = 2           # Bucket capacity (requests allowed back-to-back)
+    jitter: float = 1.0      # Random extra delay (0..jitter seconds) to look less robotic
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    throttled_requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket using reservations
+
+    Callers take a token immediately and are told how long to wait before using it,
+    so the lock is never held while sleeping.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 1e-6)
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the number of seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+def host_key(url: str) -> str:
+    """Normalise a URL (or bare host) to the key used for per-host limiting"""
+    netloc = urlparse(url).netloc if '://' in url else url
+    netloc = netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+class HostRateLimiter:
+    """
+    Rate limiter keyed by host
+
+    Every host gets its own token bucket built from the default config unless an
+    override was registered with configure_host().
+    """
+
+    def __init__(self, default_config: Optional[RateLimitConfig] = None):
+        self.default_config = default_config or RateLimitConfig()
+        self.enabled = True
+        self._overrides: Dict[str, RateLimitConfig] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    def configure_host(self, url_or_host: str, config: RateLimitConfig):
+        """Override the limits for a single host"""
+        key = host_key(url_or_host)
+        with self._lock:
+            self._overrides[key] = config
+            self._buckets.pop(key, None)
+
+    def config_for(self, url: str) -> RateLimitConfig:
+        return self._overrides.get(host_key(url), self.default_config)
+
+    def _bucket(self, key: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                config = self._overrides.get(key, self.default_config)
+                bucket = TokenBucket(config.rate, config.burst)
+                self._buckets[key] = bucket
+                self._stats[key] = HostStats()
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to url's host is allowed; returns seconds spent waiting"""
+        if not self.enabled:
+            return 0.0
+
+        key = host_key(url)
+        config = self._overrides.get(key, self.default_config)
+        wait = self._bucket(key).reserve()
+
+        if config.jitter > 0:
+            wait += random.uniform(0, config.jitter)
+        if wait > 0:
+            time.sleep(wait)
+
+        with self._lock:
+            stats = self._stats[key]
+            stats.requests += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            if wait > config.jitter:
+                stats.throttled_requests += 1
+
+        return wait
+
+    def stats(self) -> Dict[str, HostStats]:
+        """Snapshot of wait-time statistics per host"""
+        with self._lock:
+            return {key: HostStats(**vars(stats)) for key, stats in self._stats.items()}
+
+    def total_wait_time(self) -> float:
+        return sum(stats.total_wait for stats in self.stats().values())
+
+    def format_report(self, top_n: int = 5) -> str:
+        """Human-readable summary of how much time was spent throttled"""
+        stats = self.stats()
+        if not stats:
+            return "Rate limiter: no requests made"
+
+        total_requests = sum(s.requests for s in stats.values())
+        total_wait = sum(s.total_wait for s in stats.values())
+
+        lines = [f"Rate limiter: {total_wait:.1f}s spent waiting across {total_requests} requests "
+                 f"to {len(stats)} hosts"]
+        busiest = sorted(stats.items(), key=lambda item: item[1].total_wait, reverse=True)[:top_n]
+        for key, host_stats in busiest:
+            lines.append(f"  {key}: {host_stats.requests} requests, "
+                         f"{host_stats.total_wait:.1f}s waiting (max {host_stats.max_wait:.1f}s, "
+                         f"{host_stats.throttled_requests} throttled)")
+        return "\n".join(lines)
@@ -0,0 +1,74 @@
+"""
+Request Coalescing
+Singleflight/memo layer so a URL shared by several code paths (or several sources)
+is fetched and parsed once per run
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Run-scoped memo with in-flight deduplication
+
+    The first caller for a key runs the function; concurrent callers for the same key
+    wait for it and share its result, and later callers get the memoized result.
+    Exceptions are not shared or memoized: if the leading call raises, waiting callers
+    run the function themselves (failures such as an exhausted per-source budget are
+    specific to the caller's thread).
+    """
+
+    def __init__(self, name: str = "Request coalescing"):
+        self.name = name
+        self.calls = 0
+        self.hits = 0
+        self._results: Dict[Hashable, Any] = {}
+        self._in_flight: Dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Result of fn() for key, calling it at most once per key while it succeeds"""
+        while True:
+            with self._lock:
+                if key in self._results:
+                    self.hits += 1
+                    return self._results[key]
+
+                event = self._in_flight.get(key)
+                leader = event is None
+                if leader:
+                    event = threading.Event()
+                    self._in_flight[key] = event
+
+            if not leader:
+                event.wait()
+                continue
+
+            try:
+                result = fn()
+            except BaseException:
+                with self._lock:
+                    del self._in_flight[key]
+                event.set()
+                raise
+
+            with self._lock:
+                self._results[key] = result
+                del self._in_flight[key]
+                self.calls += 1
+            event.set()
+            return result
+
+    def forget(self, key: Hashable):
+        with self._lock:
+            self._results.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.calls = 0
+            self.hits = 0
+
+    def format_report(self) -> str:
+        return f"{self.name}: {self.calls} distinct, {self.hits} duplicates served from memory"
@@ -0,0 +1,174 @@
+"""
+Semantic Relevance
+Optional stage between discovery and full-page extraction: candidates' title +
+summary are embedded with a small CPU sentence-embedding model and compared with
+per-topic prototype embeddings from the taxonomy, so pages are only fetched for
+candidates that are about one of our topics. Enabled with SEMANTIC_RELEVANCE=1
+(needs sentence-transformers); embeddings are cached on disk by content hash
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from http_cache import DEFAULT_CACHE_DIR
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+SEMANTIC_ENABLED = os.getenv('SEMANTIC_RELEVANCE', '').lower() in ('1', 'true', 'yes', 'on')
+DEFAULT_MODEL = os.getenv('SEMANTIC_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+DEFAULT_THRESHOLD = float(os.getenv('SEMANTIC_THRESHOLD', '0.3'))
+
+
+def _content_key(model_name: str, text: str) -> str:
+    return hashlib.sha256(f"{model_name}\n{text}".encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite store of float32 embeddings keyed by sha256(model name + text)"""
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, 'embeddings.sqlite'), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._db.commit()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, 'np.ndarray']:
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = list(keys[start:start + 500])
+                placeholders = ", ".join("?" for _ in chunk)
+                for key, vector in self._db.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk):
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+        return found
+
+    def put_many(self, items: Dict[str, 'np.ndarray']):
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dim, vector, created_at) VALUES (?, ?, ?, ?)",
+                [(key, len(vector), np.asarray(vector, dtype=np.float32).tobytes(), now)
+                 for key, vector in items.items()]
+            )
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class SemanticRelevance:
+    """
+    Scores texts by cosine similarity to the closest topic prototype
+
+    The model is loaded on first use. All texts passed to one call are embedded
+    in a single batch (cache misses only); prototypes are embedded once.
+    """
+
+    def __init__(self, topics: Dict[str, List[str]], model_name: str = DEFAULT_MODEL,
+                 threshold: float = DEFAULT_THRESHOLD, cache_dir: str = None, batch_size: int = 64):
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers is required for semantic relevance: "
+                              "pip install sentence-transformers")
+        if not topics:
+            raise ValueError("Semantic relevance needs at least one topic with prototype texts")
+
+        self.topics = topics
+        self.model_name = model_name
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.cache = EmbeddingCache(cache_dir)
+        self.kept = 0
+        self.dropped = 0
+
+        self._model = None
+        self._prototypes = None
+        self._prototype_topics: List[str] = []
+        self._lock = threading.Lock()
+
+    def _get_model(self):
+        with self._lock:
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name, device='cpu')
+            return self._model
+
+    def embed(self, texts: Sequence[str]) -> 'np.ndarray':
+        """Unit-length embeddings of texts, one row each"""
+        keys = [_content_key(self.model_name, text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if missing:
+            vectors = self._get_model().encode(
+                list(missing.values()), batch_size=self.batch_size,
+                normalize_embeddings=True, show_progress_bar=False
+            )
+            computed = dict(zip(missing, np.asarray(vectors, dtype=np.float32)))
+            self.cache.put_many(computed)
+            cached.update(computed)
+
+        return np.vstack([cached[key] for key in keys])
+
+    def _prototype_matrix(self) -> 'np.ndarray':
+        if self._prototypes is None:
+            texts = []
+            for topic, prototypes in self.topics.items():
+                texts.extend(prototypes)
+                self._prototype_topics.extend([topic] * len(prototypes))
+            self._prototypes = self.embed(texts)
+        return self._prototypes
+
+    def scores(self, texts: Sequence[str]) -> List[Tuple[float, str]]:
+        """(similarity to the closest prototype, its topic) for every text"""
+        if not texts:
+            return []
+        similarities = self.embed(texts) @ self._prototype_matrix().T
+        best = similarities.argmax(axis=1)
+        return [(float(similarities[row, column]), self._prototype_topics[column])
+                for row, column in enumerate(best)]
+
+    def filter(self, items: Sequence, text: Callable,
+               on_score: Optional[Callable] = None) -> Tuple[list, list]:
+        """
+        Split items into (kept, dropped) by similarity threshold, in one batch
+
+        on_score(item, similarity, topic) is called for every item before the split.
+        """
+        kept, dropped = [], []
+        for item, (similarity, topic) in zip(items, self.scores([text(item) for item in items])):
+            if on_score is not None:
+                on_score(item, similarity, topic)
+            (kept if similarity >= self.threshold else dropped).append(item)
+        self.kept += len(kept)
+        self.dropped += len(dropped)
+        return kept, dropped
+
+    def format_report(self) -> str:
+        return (f"Semantic relevance ({self.model_name}, threshold {self.threshold}): "
+                f"{self.kept} candidates kept, {self.dropped} dropped before fetching | "
+                f"embedding cache {self.cache.hits} hits, {self.cache.misses} misses")
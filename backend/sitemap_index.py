@@ -0,0 +1,227 @@
+"""
+Persistent Sitemap Index
+Per-publication store of every URL in a publication's sitemaps, refreshed
+incrementally with conditional GETs, for instant "is this URL in the sitemap?" lookups
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from http_cache import DEFAULT_CACHE_DIR
+from sitemap_parser import iter_sitemap
+from url_utils import normalize_url, slug_tokens
+
+
+class SitemapIndexError(Exception):
+    """Raised when a publication's root sitemap cannot be fetched"""
+
+
+@dataclass
+class RefreshStats:
+    sitemaps_parsed: int = 0
+    sitemaps_unchanged: int = 0
+    sitemaps_failed: int = 0
+    urls_indexed: int = 0
+
+
+class SitemapIndex:
+    """
+    SQLite index of sitemap URLs, keyed by (publication, normalize_url(url))
+
+    Each sitemap's URLs are tracked with the sitemap they came from, so refreshing
+    replaces only the sitemaps that changed: a 304 from a sitemap we have already
+    indexed costs no parsing at all, and children that disappear from a sitemap
+    index are dropped. A token table (words of each URL's slug) answers "similar
+    URL" queries without scanning.
+    """
+
+    def __init__(self, cache_dir: str = None, max_age_seconds: float = 3600.0):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_age_seconds = max_age_seconds
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, 'sitemap_index.sqlite'), check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS sitemaps (
+                sitemap_url TEXT PRIMARY KEY,
+                publication TEXT NOT NULL,
+                parent TEXT,
+                refreshed_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                publication TEXT NOT NULL,
+                norm_url TEXT NOT NULL,
+                url TEXT NOT NULL,
+                lastmod TEXT,
+                sitemap_url TEXT NOT NULL,
+                PRIMARY KEY (publication, norm_url)
+            );
+            CREATE TABLE IF NOT EXISTS tokens (
+                publication TEXT NOT NULL,
+                token TEXT NOT NULL,
+                norm_url TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS urls_sitemap ON urls (sitemap_url);
+            CREATE INDEX IF NOT EXISTS tokens_lookup ON tokens (publication, token);
+            CREATE INDEX IF NOT EXISTS tokens_url ON tokens (publication, norm_url);
+        """)
+        self._db.commit()
+
+    def is_fresh(self, publication: str) -> bool:
+        """Whether publication's root sitemap was refreshed within max_age_seconds"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MAX(refreshed_at) FROM sitemaps WHERE publication = ? AND parent IS NULL",
+                (publication,)
+            ).fetchone()
+        return bool(row and row[0]) and time.time() - row[0] < self.max_age_seconds
+
+    def refresh(self, publication: str, sitemap_url: str, fetch: Callable) -> RefreshStats:
+        """
+        Bring publication's entries up to date
+
+        fetch(url) must return a response for a conditional GET (with not_modified
+        set on a 304 answered from the HTTP cache), e.g. a collector's make_request.
+        Sitemap indexes are walked one level deep; every child is revalidated.
+        """
+        stats = RefreshStats()
+        response = fetch(sitemap_url)
+        if response.status_code != 200:
+            raise SitemapIndexError(f"Failed to fetch sitemap (HTTP {response.status_code})")
+
+        children = [entry.loc for entry in iter_sitemap(response.content) if entry.is_sitemap]
+        if not children:
+            self._index_sitemap(publication, sitemap_url, None, response, stats)
+            return stats
+
+        self._mark_refreshed(publication, sitemap_url, None)
+        self._drop_missing_children(sitemap_url, children)
+        for child_url in children:
+            try:
+                child_response = fetch(child_url)
+            except Exception:
+                stats.sitemaps_failed += 1
+                continue
+            if child_response.status_code != 200:
+                stats.sitemaps_failed += 1
+                continue
+            try:
+                self._index_sitemap(publication, child_url, sitemap_url, child_response, stats)
+            except Exception:
+                stats.sitemaps_failed += 1
+        return stats
+
+    def _index_sitemap(self, publication: str, sitemap_url: str, parent: Optional[str],
+                       response, stats: RefreshStats):
+        if getattr(response, 'not_modified', False) and self._has_sitemap(sitemap_url):
+            self._mark_refreshed(publication, sitemap_url, parent)
+            stats.sitemaps_unchanged += 1
+            return
+
+        rows, token_rows = [], []
+        for entry in iter_sitemap(response.content):
+            if entry.is_sitemap:
+                continue
+            norm_url = normalize_url(entry.loc)
+            lastmod = entry.news_publication_date or entry.lastmod
+            rows.append((publication, norm_url, entry.loc, lastmod.isoformat() if lastmod else None, sitemap_url))
+            token_rows.extend((publication, token, norm_url) for token in slug_tokens(entry.loc))
+
+        with self._lock:
+            self._delete_sitemap_urls_locked(sitemap_url)
+            # A URL listed by several sitemaps keeps one set of tokens
+            self._db.executemany("DELETE FROM tokens WHERE publication = ? AND norm_url = ?",
+                                 [(row[0], row[1]) for row in rows])
+            self._db.executemany(
+                "INSERT OR REPLACE INTO urls (publication, norm_url, url, lastmod, sitemap_url) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._db.executemany("INSERT INTO tokens (publication, token, norm_url) VALUES (?, ?, ?)", token_rows)
+            self._db.execute(
+                "INSERT OR REPLACE INTO sitemaps (sitemap_url, publication, parent, refreshed_at) VALUES (?, ?, ?, ?)",
+                (sitemap_url, publication, parent, time.time())
+            )
+            self._db.commit()
+
+        stats.sitemaps_parsed += 1
+        stats.urls_indexed += len(rows)
+
+    def _has_sitemap(self, sitemap_url: str) -> bool:
+        with self._lock:
+            return self._db.execute(
+                "SELECT 1 FROM sitemaps WHERE sitemap_url = ?", (sitemap_url,)
+            ).fetchone() is not None
+
+    def _mark_refreshed(self, publication: str, sitemap_url: str, parent: Optional[str]):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sitemaps (sitemap_url, publication, parent, refreshed_at) VALUES (?, ?, ?, ?)",
+                (sitemap_url, publication, parent, time.time())
+            )
+            self._db.commit()
+
+    def _drop_missing_children(self, index_url: str, children: List[str]):
+        with self._lock:
+            known = [row[0] for row in self._db.execute(
+                "SELECT sitemap_url FROM sitemaps WHERE parent = ?", (index_url,)
+            )]
+            # The index itself lists no articles (it may have been a urlset before)
+            self._delete_sitemap_urls_locked(index_url)
+            for child_url in set(known) - set(children):
+                self._delete_sitemap_urls_locked(child_url)
+                self._db.execute("DELETE FROM sitemaps WHERE sitemap_url = ?", (child_url,))
+            self._db.commit()
+
+    def _delete_sitemap_urls_locked(self, sitemap_url: str):
+        self._db.execute("""
+            DELETE FROM tokens WHERE rowid IN (
+                SELECT tokens.rowid FROM tokens JOIN urls
+                  ON tokens.publication = urls.publication AND tokens.norm_url = urls.norm_url
+                WHERE urls.sitemap_url = ?
+            )
+        """, (sitemap_url,))
+        self._db.execute("DELETE FROM urls WHERE sitemap_url = ?", (sitemap_url,))
+
+    def lookup(self, publication: str, url: str) -> Optional[Tuple[str, Optional[datetime]]]:
+        """(url as listed in the sitemap, lastmod) if url is indexed for publication"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, lastmod FROM urls WHERE publication = ? AND norm_url = ?",
+                (publication, normalize_url(url))
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], datetime.fromisoformat(row[1]) if row[1] else None
+
+    def similar(self, publication: str, url: str, limit: int = 5) -> List[str]:
+        """Indexed URLs sharing the most slug words with url, best first"""
+        tokens = slug_tokens(url)
+        if not tokens:
+            return []
+        placeholders = ", ".join("?" for _ in tokens)
+        with self._lock:
+            rows = self._db.execute(f"""
+                SELECT urls.url, COUNT(DISTINCT tokens.token) AS shared FROM tokens
+                JOIN urls ON urls.publication = tokens.publication AND urls.norm_url = tokens.norm_url
+                WHERE tokens.publication = ? AND tokens.token IN ({placeholders})
+                GROUP BY tokens.norm_url
+                ORDER BY shared DESC, urls.lastmod DESC
+                LIMIT ?
+            """, (publication, *tokens, limit)).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, publication: str) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM urls WHERE publication = ?", (publication,)
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,126 @@
+"""
+Streaming Sitemap Parser
+Single-pass lxml iterparse over the sitemap bytes (gzip detected from the magic
+number), yielding entries one at a time and discarding each parsed element so
+memory stays bounded on multi-megabyte sitemaps
+"""
+
+import gzip
+import io
+from datetime import datetime
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+from lxml import etree
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+class SitemapParseError(Exception):
+    """Raised when a document is not a urlset or sitemapindex we can read"""
+
+
+class SitemapEntry(NamedTuple):
+    loc: str
+    lastmod: Optional[datetime]
+    is_sitemap: bool = False  # True for the children of a sitemapindex
+    # Google News sitemap extension (<news:news>), when present
+    news_title: Optional[str] = None
+    news_keywords: Optional[str] = None
+    news_publication_date: Optional[datetime] = None
+
+
+def parse_lastmod(text: Optional[str]) -> Optional[datetime]:
+    """Parse a W3C datetime (or bare date) into a naive datetime, None if missing or invalid"""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        if 'T' in text:
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        else:
+            parsed = datetime.strptime(text[:10], '%Y-%m-%d')
+        return parsed.replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def open_sitemap_stream(content: bytes) -> BinaryIO:
+    """Byte stream over content, transparently gunzipping .xml.gz sitemaps"""
+    stream = io.BytesIO(content)
+    if content[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def _localname(tag) -> str:
+    return etree.QName(tag).localname if isinstance(tag, str) else ''
+
+
+def _news_fields(news_element) -> dict:
+    """SitemapEntry keyword arguments from a <news:news> element"""
+    fields = {}
+    for child in news_element:
+        child_name = _localname(child.tag)
+        if child_name == 'title' and child.text:
+            fields['news_title'] = child.text.strip()
+        elif child_name == 'keywords' and child.text:
+            fields['news_keywords'] = child.text.strip()
+        elif child_name == 'publication_date':
+            fields['news_publication_date'] = parse_lastmod(child.text)
+    return fields
+
+
+def iter_sitemap(content: bytes) -> Iterator[SitemapEntry]:
+    """
+    Yield the entries of a urlset (<url>) or sitemapindex (<sitemap>) as they are parsed
+
+    Google News <news:title>, <news:keywords> and <news:publication_date> are read
+    from each <url> when present.
+    Namespaces are ignored, so unqualified and oddly-prefixed sitemaps work too, and
+    lxml's recover mode gets past bad bytes and stray markup. Stop iterating whenever
+    enough entries have been seen; the rest of the document is never parsed.
+    Raises SitemapParseError if the root element is neither urlset nor sitemapindex.
+    """
+    stream = open_sitemap_stream(content)
+    parser = etree.iterparse(stream, events=('start', 'end'), recover=True, huge_tree=True,
+                             resolve_entities=False, no_network=True)
+
+    root_kind = None
+    try:
+        for event, element in parser:
+            name = _localname(element.tag)
+
+            if root_kind is None:
+                if name not in ('urlset', 'sitemapindex'):
+                    raise SitemapParseError(f"Not a sitemap (root element <{name}>)")
+                root_kind = name
+                continue
+
+            if event != 'end' or name not in ('url', 'sitemap'):
+                continue
+
+            loc, lastmod = None, None
+            news = {}
+            for child in element:
+                child_name = _localname(child.tag)
+                if child_name == 'loc' and child.text:
+                    loc = child.text.strip()
+                elif child_name == 'lastmod':
+                    lastmod = parse_lastmod(child.text)
+                elif child_name == 'news':
+                    news = _news_fields(child)
+
+            # Drop the parsed element and any earlier siblings still attached to the root
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+            if loc:
+                yield SitemapEntry(loc, lastmod, name == 'sitemap', **news)
+    except (etree.XMLSyntaxError, OSError, EOFError) as e:
+        if root_kind is None:
+            raise SitemapParseError(f"Cannot parse XML: {e}") from e
+        # Truncated or corrupt tail: keep what was parsed before it
+
+    if root_kind is None:
+        raise SitemapParseError("Cannot parse XML: empty document")
@@ -9,23 +9,18 @@ from urllib.parse import urlparse, urljoin
 import time
 import json
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
 import random
+from http_cache import HTTPCache
+from html_cache import get_default_html_cache
+from sitemap_parser import iter_sitemap, SitemapParseError
+from sitemap_index import SitemapIndex, SitemapIndexError
 
-# Try to import curl-cffi (most powerful anti-blocking)
-try:
-    from curl_cffi import requests as curl_requests
-    CURL_CFFI_AVAILABLE = True
-except ImportError:
-    CURL_CFFI_AVAILABLE = False
-    print("Note: Install curl-cffi for best anti-blocking: pip install curl-cffi")
+# Anti-blocking clients (curl-cffi, then cloudscraper, then requests) come from the shared pool
+from client_pool import get_default_client_pool, CURL_CFFI_AVAILABLE, CLOUDSCRAPER_AVAILABLE
 
-# Try to import cloudscraper (fallback)
-try:
-    import cloudscraper
-    CLOUDSCRAPER_AVAILABLE = True
-except ImportError:
-    CLOUDSCRAPER_AVAILABLE = False
+if not CURL_CFFI_AVAILABLE:
+    print("Note: Install curl-cffi for best anti-blocking: pip install curl-cffi")
+if not CLOUDSCRAPER_AVAILABLE:
     print("Note: Install cloudscraper for better anti-blocking: pip install cloudscraper")
 
 @dataclass
@@ -241,26 +236,16 @@ class CustomArticleCollector:
             }
         }
 
-        # Initialize scraper with priority order
-        if CURL_CFFI_AVAILABLE:
+        # Shared client pool: keep-alive sessions per host, reused across entry points
+        self.client_pool = get_default_client_pool()
+        self.scraper_type = self.client_pool.scraper_type
+        if self.scraper_type == 'curl-cffi':
             # curl-cffi is the most powerful - mimics real browsers perfectly
-            self.scraper = curl_requests.Session()
-            self.scraper_type = 'curl-cffi'
             print("✅ curl-cffi enabled (most powerful anti-blocking)")
             print("   Can bypass CloudFlare, SSL checks, and bot detection\n")
-        elif CLOUDSCRAPER_AVAILABLE:
-            self.scraper = cloudscraper.create_scraper(
-                browser={
-                    'browser': 'chrome',
-                    'platform': 'windows',
-                    'mobile': False
-                }
-            )
-            self.scraper_type = 'cloudscraper'
+        elif self.scraper_type == 'cloudscraper':
             print("✅ CloudScraper enabled for anti-blocking\n")
         else:
-            self.scraper = requests.Session()
-            self.scraper_type = 'requests'
             print("⚠️  Using basic requests (limited anti-blocking)\n")
 
         # User-Agent rotation
@@ -282,6 +267,15 @@ class CustomArticleCollector:
         self.requests_per_source = 0
         self.max_requests_per_minute = 20
 
+        # Conditional-GET cache for sitemaps and RSS feeds (shared with AgentCollector)
+        self.http_cache = HTTPCache()
+
+        # Article pages are cached by content hash and shared with AgentCollector and AgentSumm
+        self.html_cache = get_default_html_cache()
+
+        # Persistent URL index of every publication's sitemaps, for search_url_in_sitemap
+        self.sitemap_index = SitemapIndex()
+
     def get_random_user_agent(self):
         return random.choice(self.user_agents)
 
@@ -303,7 +297,7 @@ class CustomArticleCollector:
             print(f"  Rate limit: Processed {self.request_count} requests, brief pause...")
             time.sleep(random.uniform(5, 10))
 
-    def make_request(self, url: str, timeout: int = 10):
+    def make_request(self, url: str, timeout: int = 10, conditional: bool = False):
         """Make HTTP request with curl-cffi for better anti-blocking"""
         self.apply_rate_limit()
 
@@ -321,19 +315,15 @@ class CustomArticleCollector:
             'Cache-Control': 'max-age=0'
         }
 
+        if conditional:
+            headers.update(self.http_cache.conditional_headers(url))
+
         try:
-            if self.scraper_type == 'curl-cffi':
-                # curl-cffi with browser impersonation (best for bypassing blocks)
-                response = self.scraper.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout,
-                    impersonate="chrome110",  # Mimics Chrome 110 perfectly
-                    verify=True
-                )
-            else:
-                # Fallback to cloudscraper or requests
-                response = self.scraper.get(url, headers=headers, timeout=timeout)
+            # Pooled session for this host (curl-cffi impersonates Chrome when available)
+            response = self.client_pool.get(url, headers=headers, timeout=timeout)
+
+            if conditional:
+                response = self._apply_http_cache(url, response)
 
             if response.status_code != 200:
                 domain = urlparse(url).netloc
@@ -355,13 +345,10 @@ class CustomArticleCollector:
                 if self.scraper_type == 'curl-cffi':
                     try:
                         print(f"    Retrying without SSL verification...")
-                        response = self.scraper.get(
-                            url,
-                            headers=headers,
-                            timeout=timeout,
-                            impersonate="chrome110",
-                            verify=False  # Disable SSL verification
-                        )
+                        response = self.client_pool.get(url, headers=headers, timeout=timeout,
+                                                        verify=False)  # Disable SSL verification
+                        if conditional:
+                            response = self._apply_http_cache(url, response)
                         return response
                     except:
                         pass
@@ -369,6 +356,27 @@ class CustomArticleCollector:
             print(f"    Request error: {error_msg[:100]}")
             raise
 
+    def fetch_article(self, url: str, timeout: int = 20):
+        """Fetch an article page, serving it from the shared HTML cache when we already have it"""
+        cached = self.html_cache.get_response(url)
+        if cached is not None:
+            return cached
+
+        response = self.make_request(url, timeout=timeout)
+        if response.status_code == 200:
+            self.html_cache.put(url, response.text)
+        return response
+
+    def _apply_http_cache(self, url: str, response):
+        """Serve 304s from the conditional-GET cache and store fresh 200s"""
+        if response.status_code == 304:
+            cached = self.http_cache.load(url)
+            if cached is not None:
+                return cached
+        elif response.status_code == 200:
+            self.http_cache.store(url, response)
+        return response
+
     def extract_author(self, article, text: str) -> str:
         """Extract author name using JSON-LD, meta tags, or regex scanning."""
         author = None
@@ -502,10 +510,9 @@ class CustomArticleCollector:
 
             if is_premium and self.scraper_type == 'curl-cffi':
                 # Use curl-cffi with special headers for premium sites
-                response = self.scraper.get(
+                response = self.client_pool.get(
                     feed_url,
                     timeout=15,
-                    impersonate="chrome110",
                     headers={
                         'User-Agent': self.get_random_user_agent(),
                         'Accept': 'application/rss+xml, application/xml, text/xml, */*',
@@ -513,7 +520,7 @@ class CustomArticleCollector:
                     }
                 )
             else:
-                response = self.make_request(feed_url, timeout=10)
+                response = self.make_request(feed_url, timeout=10, conditional=True)
 
             if response.status_code != 200:
                 return candidates
@@ -660,29 +667,11 @@ class CustomArticleCollector:
         """Fetch ALL URLs from sitemap recursively"""
         urls = []
         try:
-            response = self.make_request(sitemap_url, timeout=10)
+            response = self.make_request(sitemap_url, timeout=10, conditional=True)
             if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    lastmod_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-
-                    if loc_elem is not None:
-                        url = loc_elem.text
-                        if lastmod_elem is not None:
-                            try:
-                                lastmod_str = lastmod_elem.text
-                                if 'T' in lastmod_str:
-                                    lastmod_date = datetime.fromisoformat(lastmod_str.replace('Z', '+00:00'))
-                                else:
-                                    lastmod_date = datetime.strptime(lastmod_str[:10], '%Y-%m-%d')
-                                lastmod_date = lastmod_date.replace(tzinfo=None)
-                            except:
-                                lastmod_date = datetime.now()
-                        else:
-                            lastmod_date = datetime.now()
-
-                        urls.append((url, lastmod_date))
+                for entry in iter_sitemap(response.content):
+                    if not entry.is_sitemap:
+                        urls.append((entry.loc, entry.lastmod or datetime.now()))
         except:
             pass
 
@@ -693,87 +682,25 @@ class CustomArticleCollector:
         candidates = []
 
         try:
-            response = self.make_request(sitemap_url, timeout=15)
+            response = self.make_request(sitemap_url, timeout=15, conditional=True)
 
             if response.status_code != 200:
                 return candidates
 
-            # Try multiple decoding strategies for problematic sitemaps
-            xml_content = None
-
-            # Strategy 1: Use response.text (auto-decodes)
+            # Single streaming pass (gzip detected from the content itself)
+            urls = []
             try:
-                xml_content = response.text
-                root = ET.fromstring(xml_content)
-            except (ET.ParseError, UnicodeDecodeError):
-                xml_content = None
-
-            # Strategy 2: Try raw content with UTF-8
-            if xml_content is None:
-                try:
-                    xml_content = response.content.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    xml_content = None
-
-            # Strategy 3: Try raw content with ISO-8859-1
-            if xml_content is None:
-                try:
-                    xml_content = response.content.decode('iso-8859-1')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    xml_content = None
-
-            # Strategy 4: Try decompressing manually then parsing
-            if xml_content is None:
-                try:
-                    import gzip
-                    decompressed = gzip.decompress(response.content)
-                    xml_content = decompressed.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except:
-                    xml_content = None
-
-            # If all strategies failed
-            if xml_content is None:
+                for entry in iter_sitemap(response.content):
+                    if entry.is_sitemap:
+                        # Check ALL sub-sitemaps (no limit)
+                        urls.extend(self.fetch_urls_from_sitemap(entry.loc))
+                    else:
+                        # Process ALL URLs in sitemap (no limit, NO DATE FILTER)
+                        urls.append((entry.loc, entry.lastmod or datetime.now()))
+            except SitemapParseError:
                 print(f"  Sitemap error: Cannot parse XML")
                 return candidates
 
-            urls = []
-
-            if 'sitemapindex' in root.tag:
-                # Check ALL sub-sitemaps (no limit)
-                for sitemap in root:
-                    loc_elem = sitemap.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    if loc_elem is not None:
-                        sub_sitemap_url = loc_elem.text
-                        urls.extend(self.fetch_urls_from_sitemap(sub_sitemap_url))
-
-            elif 'urlset' in root.tag:
-                # Process ALL URLs in sitemap (no limit)
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    lastmod_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-
-                    if loc_elem is not None:
-                        url = loc_elem.text
-
-                        if lastmod_elem is not None:
-                            try:
-                                lastmod_str = lastmod_elem.text
-                                if 'T' in lastmod_str:
-                                    lastmod_date = datetime.fromisoformat(lastmod_str.replace('Z', '+00:00'))
-                                else:
-                                    lastmod_date = datetime.strptime(lastmod_str[:10], '%Y-%m-%d')
-                                lastmod_date = lastmod_date.replace(tzinfo=None)
-                                # NO DATE FILTER
-                            except:
-                                lastmod_date = datetime.now()
-                        else:
-                            lastmod_date = datetime.now()
-
-                        urls.append((url, lastmod_date))
-
             print(f"  Found {len(urls)} total URLs in sitemap")
 
             # Filter by URL relevance only (fast, no downloads needed)
@@ -859,8 +786,14 @@ class CustomArticleCollector:
 
         return unique_candidates
 
-    def search_url_in_sitemap(self, publication: str, search_url: str) -> dict:
-        """Search for a specific URL in a publication's sitemap"""
+    def search_url_in_sitemap(self, publication: str, search_url: str, refresh: bool = None) -> dict:
+        """
+        Search for a specific URL in a publication's sitemap
+
+        Lookups go through the persistent sitemap index. It is refreshed (with
+        conditional GETs, so unchanged sitemaps are not re-parsed) when older than an
+        hour, or always/never when refresh is True/False.
+        """
         if publication not in self.target_sources:
             return {'found': False, 'error': f'Publication "{publication}" not found'}
 
@@ -874,96 +807,63 @@ class CustomArticleCollector:
             print(f"\nSearching for URL in {publication} sitemap...")
             print(f"Target URL: {search_url}\n")
 
-            response = self.make_request(sitemap_url, timeout=15)
-
-            if response.status_code != 200:
-                return {'found': False, 'error': f'Failed to fetch sitemap (HTTP {response.status_code})'}
-
-            # Try multiple decoding strategies
-            xml_content = None
-            try:
-                xml_content = response.text
-                root = ET.fromstring(xml_content)
-            except (ET.ParseError, UnicodeDecodeError):
-                pass
+            if refresh is None:
+                refresh = not self.sitemap_index.is_fresh(publication)
 
-            if xml_content is None:
+            if refresh:
                 try:
-                    xml_content = response.content.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except (ET.ParseError, UnicodeDecodeError):
-                    pass
-
-            if xml_content is None:
-                try:
-                    import gzip
-                    decompressed = gzip.decompress(response.content)
-                    xml_content = decompressed.decode('utf-8')
-                    root = ET.fromstring(xml_content)
-                except:
+                    stats = self.sitemap_index.refresh(
+                        publication, sitemap_url,
+                        lambda url: self.make_request(url, timeout=15, conditional=True)
+                    )
+                except SitemapIndexError as e:
+                    return {'found': False, 'error': str(e)}
+                except SitemapParseError:
                     return {'found': False, 'error': 'Could not parse sitemap XML'}
+                print(f"Sitemap index refreshed: {stats.sitemaps_parsed} parsed, "
+                      f"{stats.sitemaps_unchanged} unchanged, {stats.sitemaps_failed} failed")
 
-            all_urls = []
-
-            # Handle sitemap index
-            if 'sitemapindex' in root.tag:
-                for sitemap in root:
-                    loc_elem = sitemap.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    if loc_elem is not None:
-                        sub_sitemap_url = loc_elem.text
-                        all_urls.extend(self.fetch_urls_from_sitemap(sub_sitemap_url))
-
-            # Handle regular sitemap
-            elif 'urlset' in root.tag:
-                for url_elem in root:
-                    loc_elem = url_elem.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                    if loc_elem is not None:
-                        all_urls.append((loc_elem.text, datetime.now()))
-
-            print(f"Total URLs found in sitemap: {len(all_urls)}\n")
-
-            # Search for the URL
-            found_url = None
-            is_relevant = False
-            for url, pub_date in all_urls:
-                if url == search_url or search_url.rstrip('/') == url.rstrip('/'):
-                    found_url = url
-                    is_relevant = self.is_relevant_url(url)
-                    break
+            total_urls = self.sitemap_index.count(publication)
+            print(f"Total URLs found in sitemap: {total_urls}\n")
+
+            # Search for the URL (normalized: scheme, www. and trailing slash don't matter)
+            match = self.sitemap_index.lookup(publication, search_url)
 
-            if found_url:
+            if match:
+                found_url, lastmod = match
+                is_relevant = self.is_relevant_url(found_url)
                 result = {
                     'found': True,
                     'url': found_url,
+                    'lastmod': lastmod.isoformat() if lastmod else None,
                     'is_relevant': is_relevant,
-                    'total_urls_in_sitemap': len(all_urls)
+                    'total_urls_in_sitemap': total_urls
                 }
                 
                 print(f"✅ URL FOUND in sitemap!")
                 print(f"   URL: {found_url}")
+                print(f"   Last modified: {result['lastmod'] or 'unknown'}")
                 print(f"   Passes keyword filter: {is_relevant}")
-                print(f"   Total URLs in sitemap: {len(all_urls)}")
+                print(f"   Total URLs in sitemap: {total_urls}")
                 
                 return result
             else:
                 result = {
                     'found': False,
-                    'total_urls_in_sitemap': len(all_urls),
+                    'total_urls_in_sitemap': total_urls,
                     'search_url': search_url
                 }
                 
                 print(f"❌ URL NOT FOUND in sitemap")
                 print(f"   Searched for: {search_url}")
-                print(f"   Total URLs in sitemap: {len(all_urls)}")
+                print(f"   Total URLs in sitemap: {total_urls}")
                 
-                # Show similar URLs (partial match)
-                similar = [url for url, _ in all_urls if search_url.split('/')[-1] in url.lower()]
+                # Show similar URLs (sharing words of the slug)
+                similar = self.sitemap_index.similar(publication, search_url, limit=5)
                 if similar:
-                    print(f"\n   Similar URLs found ({len(similar)}):")
-                    for sim_url in similar[:5]:
+                    print(f"\n   Similar URLs found:")
+                    for sim_url in similar:
                         print(f"     - {sim_url}")
-                    if len(similar) > 5:
-                        print(f"     ... and {len(similar) - 5} more")
                 
                 return result
 
@@ -973,7 +873,7 @@ class CustomArticleCollector:
     def extract_title_from_page(self, url: str) -> Optional[str]:
         """Quickly extract just the title from a page (without full parsing)"""
         try:
-            response = self.make_request(url, timeout=10)
+            response = self.fetch_article(url, timeout=10)
             if response.status_code != 200:
                 return None
 
@@ -990,7 +890,7 @@ class CustomArticleCollector:
         """Extract full content and calculate final relevance score"""
         try:
             # Download HTML using curl-cffi
-            response = self.make_request(candidate.url, timeout=20)
+            response = self.fetch_article(candidate.url, timeout=20)
 
             if response.status_code != 200:
                 return None
@@ -0,0 +1,113 @@
+import pytest
+
+import circuit_breaker
+from circuit_breaker import HostCircuitBreaker
+
+URL = "https://blocked.example.com/article"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', fake)
+    return fake
+
+
+@pytest.fixture
+def breaker(clock):
+    breaker = HostCircuitBreaker(failure_threshold=3, base_cooldown=100.0, max_cooldown=250.0)
+    for _ in range(3):
+        breaker.record_failure(URL)
+    return breaker
+
+
+def test_opens_after_threshold_failures(clock):
+    breaker = HostCircuitBreaker(failure_threshold=3, base_cooldown=100.0)
+    assert breaker.record_failure(URL) is False
+    assert breaker.record_failure(URL) is False
+    assert breaker.allow(URL)
+    assert breaker.record_failure(URL) is True
+    assert breaker.is_open(URL)
+    assert breaker.cooldown_for(URL) == 100.0
+
+
+def test_success_resets_failure_count(clock):
+    breaker = HostCircuitBreaker(failure_threshold=3)
+    breaker.record_failure(URL)
+    breaker.record_failure(URL)
+    breaker.record_success(URL)
+    assert breaker.record_failure(URL) is False
+    assert not breaker.is_open(URL)
+
+
+def test_refuses_during_cooldown(breaker, clock):
+    clock.now += 99.0
+    assert not breaker.allow(URL)
+    assert not breaker.allow(URL)
+    assert "2 requests skipped" in breaker.format_report()
+
+
+def test_hosts_are_independent(breaker):
+    assert breaker.allow("https://other.example.org/")
+    assert breaker.allow("https://www.blocked.example.com/") is False
+
+
+def test_single_trial_after_cooldown(breaker, clock):
+    clock.now += 100.0
+    assert not breaker.is_open(URL)
+    assert breaker.allow(URL)
+    # Only one request probes the host while the trial is in flight
+    assert not breaker.allow(URL)
+
+
+def test_trial_success_closes_circuit(breaker, clock):
+    clock.now += 100.0
+    assert breaker.allow(URL)
+    breaker.record_success(URL)
+    assert breaker.allow(URL)
+    assert breaker.allow(URL)
+    assert "closed, tripped 1x" in breaker.format_report()
+
+
+def test_trial_failure_reopens_with_double_cooldown(breaker, clock):
+    clock.now += 100.0
+    assert breaker.allow(URL)
+    assert breaker.record_failure(URL) is True
+    assert breaker.cooldown_for(URL) == 200.0
+
+    clock.now += 199.0
+    assert not breaker.allow(URL)
+    clock.now += 1.0
+    assert breaker.allow(URL)
+
+
+def test_cooldown_is_capped(breaker, clock):
+    for _ in range(3):
+        clock.now += breaker.cooldown_for(URL)
+        assert breaker.allow(URL)
+        breaker.record_failure(URL)
+    assert breaker.cooldown_for(URL) == 250.0
+
+
+def test_failures_while_open_do_not_extend_cooldown(breaker, clock):
+    assert breaker.record_failure(URL) is False
+    assert breaker.cooldown_for(URL) == 100.0
+    clock.now += 100.0
+    assert breaker.allow(URL)
+
+
+def test_end_trial_releases_unsent_trial(breaker, clock):
+    clock.now += 100.0
+    assert breaker.allow(URL)
+    breaker.end_trial(URL)
+    # The circuit stays half-open and the next request gets the trial
+    assert breaker.allow(URL)
+    assert not breaker.allow(URL)
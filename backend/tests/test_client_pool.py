@@ -0,0 +1,45 @@
+import threading
+
+from client_pool import ClientPool
+
+URL = "https://example.com/feed"
+
+
+def _check_out(pool, url, results):
+    try:
+        with pool.session(url) as session:
+            results.append(session)
+    except RuntimeError as e:
+        results.append(e)
+
+
+def test_failed_session_creation_frees_the_slot(monkeypatch):
+    pool = ClientPool(max_sessions_per_host=1)
+    attempts = []
+
+    def create_session():
+        attempts.append(1)
+        if len(attempts) <= 2:
+            raise RuntimeError("incompatible urllib3")
+        return object()
+
+    monkeypatch.setattr(pool, '_create_session', create_session)
+
+    # A leaked slot makes the next checkout wait forever, so run them off the test thread
+    results = []
+    worker = threading.Thread(target=lambda: [_check_out(pool, URL, results) for _ in range(3)], daemon=True)
+    worker.start()
+    worker.join(timeout=2)
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError, object]
+    assert pool.sessions_created == 1
+
+
+def test_sessions_are_reused_per_host(monkeypatch):
+    pool = ClientPool(max_sessions_per_host=2)
+    monkeypatch.setattr(pool, '_create_session', object)
+    with pool.session(URL) as first:
+        pass
+    with pool.session(URL) as second:
+        pass
+    assert first is second and pool.sessions_created == 1
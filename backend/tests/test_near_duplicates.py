@@ -0,0 +1,83 @@
+import random
+import threading
+
+from near_duplicates import NearDuplicateIndex, drop_near_duplicates, hamming_distance, simhash
+
+_rng = random.Random(7)
+VOCABULARY = [f"word{i}" for i in range(2000)]
+
+
+def article(words=400):
+    return " ".join(_rng.choice(VOCABULARY) for _ in range(words))
+
+
+STORY = article()
+OTHER_STORY = article()
+
+
+def edited(text, every=60):
+    words = text.split()
+    for position in range(0, len(words), every):
+        words[position] = "edited"
+    return " ".join(words)
+
+
+def test_simhash_ignores_case_and_punctuation():
+    assert simhash("The Crown Jewels, on display!") == simhash("the crown jewels on display")
+
+
+def test_lightly_edited_copy_is_close():
+    assert hamming_distance(simhash(STORY), simhash(edited(STORY))) <= 8
+
+
+def test_unrelated_articles_are_far_apart():
+    assert hamming_distance(simhash(STORY), simhash(OTHER_STORY)) > 8
+
+
+def test_index_finds_near_duplicates_only():
+    index = NearDuplicateIndex()
+    index.add("original", simhash(STORY))
+    index.add("other", simhash(OTHER_STORY))
+    assert index.matches(simhash(edited(STORY))) == ["original"]
+    index.clear()
+    assert index.matches(simhash(STORY)) == []
+
+
+def test_check_and_add_indexes_unblocked_key():
+    index = NearDuplicateIndex()
+    assert index.check_and_add("first", simhash(STORY)) is None
+    assert index.check_and_add("copy", simhash(edited(STORY))) == "first"
+    # A blocked key is not indexed
+    assert index.matches(simhash(STORY)) == ["first"]
+
+
+def test_check_and_add_predicate_decides_blocking():
+    index = NearDuplicateIndex()
+    index.check_and_add("weak", simhash(STORY))
+    assert index.check_and_add("strong", simhash(edited(STORY)), blocks=lambda match: False) is None
+    assert sorted(index.matches(simhash(STORY))) == ["strong", "weak"]
+
+
+def test_check_and_add_admits_one_of_concurrent_copies():
+    index = NearDuplicateIndex()
+    fingerprint = simhash(STORY)
+    start = threading.Barrier(8)
+    results = []
+
+    def add(key):
+        start.wait()
+        results.append(index.check_and_add(key, fingerprint))
+
+    threads = [threading.Thread(target=add, args=(key,)) for key in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results.count(None) == 1
+
+
+def test_drop_near_duplicates_keeps_best_copy_in_order():
+    items = [("wire", STORY, 1.0), ("unrelated", OTHER_STORY, 2.0), ("rewrite", edited(STORY), 5.0)]
+    kept, dropped = drop_near_duplicates(items, text=lambda item: item[1], score=lambda item: item[2])
+    assert [item[0] for item in kept] == ["unrelated", "rewrite"]
+    assert [(item[0], copy[0]) for item, copy in dropped] == [("wire", "rewrite")]
@@ -0,0 +1,87 @@
+import pytest
+
+from url_utils import canonicalize_url, dedup_key, normalize_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://Example.COM/news/story", "https://example.com/news/story"),
+    ("https://example.com:443/news/story", "https://example.com/news/story"),
+    ("http://example.com:80/news/story", "http://example.com/news/story"),
+    ("https://example.com:8443/news/story", "https://example.com:8443/news/story"),
+    ("https://example.com/news/story#comments", "https://example.com/news/story"),
+])
+def test_canonicalize_host_port_and_fragment(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_strips_tracking_params():
+    url = ("https://example.com/story?id=7&utm_source=twitter&UTM_Medium=social"
+           "&fbclid=abc&at_medium=rss&ref=home")
+    assert canonicalize_url(url) == "https://example.com/story?id=7"
+
+
+def test_canonicalize_keeps_untouched_query_verbatim():
+    url = "https://example.com/search?q=crown+jewels&page=2"
+    assert canonicalize_url(url) == url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://amp.example.com/story", "https://example.com/story"),
+    ("https://example.com/story/amp", "https://example.com/story"),
+    ("https://example.com/story/amp/", "https://example.com/story"),
+    ("https://example.com/amp/story", "https://example.com/story"),
+    ("https://example.com/story.amp.html", "https://example.com/story.html"),
+    ("https://example.com/story?amp", "https://example.com/story"),
+    ("https://example.com/story?outputType=amp&id=3", "https://example.com/story?id=3"),
+])
+def test_canonicalize_amp_variants(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_does_not_touch_amp_inside_words():
+    url = "https://example.com/champagne/amplifier"
+    assert canonicalize_url(url) == url
+
+
+def test_canonical_link_is_followed():
+    assert canonicalize_url("https://example.com/story?utm_source=x",
+                            "https://www.example.com/news/story") == "https://www.example.com/news/story"
+
+
+def test_relative_canonical_link_is_resolved():
+    assert canonicalize_url("https://example.com/a/b/story", "/news/story") == "https://example.com/news/story"
+
+
+@pytest.mark.parametrize("link", [None, "", "   ", "javascript:void(0)", "mailto:desk@example.com"])
+def test_unusable_canonical_link_is_ignored(link):
+    assert canonicalize_url("https://example.com/story", link) == "https://example.com/story"
+
+
+def test_normalize_url_drops_scheme_www_and_trailing_slash():
+    assert normalize_url("https://www.Example.com/story/") == "example.com/story"
+    assert normalize_url("http://example.com/story") == "example.com/story"
+
+
+def test_normalize_url_sorts_query():
+    assert normalize_url("https://example.com/s?b=2&a=1") == normalize_url("https://example.com/s?a=1&b=2")
+
+
+@pytest.mark.parametrize("variant", [
+    "http://www.example.com/news/story/",
+    "https://example.com/news/story?utm_campaign=daily",
+    "https://amp.example.com/news/story/amp",
+    "https://example.com/news/story#top",
+    "https://EXAMPLE.com:443/news/story?fbclid=1",
+])
+def test_dedup_key_matches_variants(variant):
+    assert dedup_key(variant) == dedup_key("https://example.com/news/story")
+
+
+def test_dedup_key_uses_canonical_link():
+    assert dedup_key("https://partner.example.org/syndicated/123",
+                     "https://example.com/news/story") == dedup_key("https://example.com/news/story")
+
+
+def test_dedup_key_keeps_distinct_articles_apart():
+    assert dedup_key("https://example.com/story?id=1") != dedup_key("https://example.com/story?id=2")
+    assert dedup_key("https://example.com/news/story") != dedup_key("https://example.com/news/other")
@@ -0,0 +1,128 @@
+"""
+Cross-Run URL Ledger
+Remembers what happened to every article URL we tried (collected, rejected, blocked),
+so re-runs in the same week skip articles an earlier run already ruled out
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Set
+
+from http_cache import DEFAULT_CACHE_DIR
+from url_utils import normalize_url
+
+# How long each outcome keeps a URL out of the fetch queue (None: never skipped).
+# Collected articles stay eligible so a re-run reproduces the same top 3; their
+# pages come from the HTML cache. 403s are often transient, so they expire sooner.
+OUTCOME_TTLS = {
+    'collected': None,
+    'rejected-score': 7 * 24 * 3600,
+    'rejected-length': 7 * 24 * 3600,
+    '404': 7 * 24 * 3600,
+    '403': 24 * 3600,
+}
+RETENTION_SECONDS = 30 * 24 * 3600
+# Outcomes that depend on the scoring rules: they only count while the keyword
+# taxonomy that produced them is unchanged
+SCORE_OUTCOMES = {'rejected-score'}
+
+
+class URLLedger:
+    """
+    SQLite ledger of per-URL outcomes, keyed by normalize_url(url)
+
+    Only the latest outcome of a URL is kept. Rows older than RETENTION_SECONDS
+    are pruned when the ledger is opened. scoring_key (the keyword taxonomy's
+    cache_key) is stored with each row, so score rejections made under other
+    rules are not skipped.
+    """
+
+    def __init__(self, cache_dir: str = None, ttls: dict = None, scoring_key: str = None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.ttls = {**OUTCOME_TTLS, **(ttls or {})}
+        self.scoring_key = scoring_key
+        self.skipped = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.cache_dir, 'url_ledger.sqlite'), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS outcomes (
+                norm_url TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                publication TEXT,
+                outcome TEXT NOT NULL,
+                score REAL,
+                recorded_at REAL NOT NULL,
+                scoring_key TEXT
+            )
+        """)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(outcomes)")}
+        if 'scoring_key' not in columns:
+            self._db.execute("ALTER TABLE outcomes ADD COLUMN scoring_key TEXT")
+        self._db.execute("DELETE FROM outcomes WHERE recorded_at < ?", (time.time() - RETENTION_SECONDS,))
+        self._db.commit()
+
+    def record(self, url: str, outcome: str, publication: str = None, score: float = None):
+        if outcome not in self.ttls:
+            raise ValueError(f"Unknown ledger outcome {outcome!r}")
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO outcomes "
+                "(norm_url, url, publication, outcome, score, recorded_at, scoring_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), url, publication, outcome, score, time.time(), self.scoring_key)
+            )
+            self._db.commit()
+
+    def outcome(self, url: str) -> Optional[str]:
+        """Latest recorded outcome for url, if any"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT outcome FROM outcomes WHERE norm_url = ?", (normalize_url(url),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def skippable(self, urls: Iterable[str]) -> Set[str]:
+        """The urls whose recorded outcome is still within its TTL"""
+        urls = list(urls)
+        if not urls:
+            return set()
+
+        by_key = {}
+        for url in urls:
+            by_key.setdefault(normalize_url(url), []).append(url)
+
+        now = time.time()
+        skip = set()
+        keys = list(by_key)
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = self._db.execute(
+                    f"SELECT norm_url, outcome, recorded_at, scoring_key FROM outcomes "
+                    f"WHERE norm_url IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for norm_url, outcome, recorded_at, scoring_key in rows:
+                    if outcome in SCORE_OUTCOMES and scoring_key != self.scoring_key:
+                        continue
+                    ttl = self.ttls.get(outcome)
+                    if ttl is not None and now - recorded_at < ttl:
+                        skip.update(by_key[norm_url])
+            self.skipped += len(skip)
+        return skip
+
+    def format_report(self) -> str:
+        with self._lock:
+            counts = dict(self._db.execute("SELECT outcome, COUNT(*) FROM outcomes GROUP BY outcome").fetchall())
+        summary = ", ".join(f"{counts[outcome]} {outcome}" for outcome in self.ttls if outcome in counts)
+        return f"URL ledger: {self.skipped} URLs skipped this run ({summary or 'empty'})"
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,114 @@
+"""
+URL Utilities
+Normalization used to key URLs in the persistent stores, so the same article
+reached as http/https, with or without www. or a trailing slash, is one entry,
+and canonicalization of article links (tracking parameters, AMP variants)
+"""
+
+import re
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_TOKEN_SPLIT = re.compile(r'[^a-z0-9]+')
+
+# Query parameters that only identify a campaign, referrer or share, never the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_ga',
+    'cmpid', 'cmp', 'smid', 'ito', 'ocid', 'mod', 'ref', 'referrer', 'sr_share', 'share',
+    'ns_mchannel', 'ns_source', 'ns_campaign', 'ns_linkname', 'ns_fee', 'taid', 'sref',
+}
+TRACKING_PREFIXES = ('utm_', 'at_', 'pk_', 'mtm_')
+AMP_PARAMS = {'amp', 'outputtype', 'amp_js_v', 'usqp'}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Scheme-less lookup key for url: 'host/path?query'
+
+    The host is lowercased with 'www.' and default ports removed, the fragment and
+    any trailing slash on the path are dropped and query parameters are sorted.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip('/')
+    key = f"{host}{path}"
+    if parts.query:
+        key += '?' + urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return key
+
+
+def slug_tokens(url: str, min_length: int = 3) -> List[str]:
+    """Distinct words of url's last path segment (the article slug), lowercased"""
+    path = urlsplit(url.strip()).path.rstrip('/')
+    slug = path.rsplit('/', 1)[-1].lower()
+    slug = slug.rsplit('.', 1)[0] if '.' in slug else slug
+
+    tokens = []
+    for token in _TOKEN_SPLIT.split(slug):
+        if len(token) >= min_length and not token.isdigit() and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def _strip_amp_path(path: str) -> str:
+    if path.endswith('/amp') or path.endswith('/amp/'):
+        path = path[:path.rfind('/amp')] or '/'
+    if path.startswith('/amp/'):
+        path = path[4:]
+    return re.sub(r'\.amp(\.html?)$', r'\1', path)
+
+
+def canonicalize_url(url: str, canonical_link: Optional[str] = None) -> str:
+    """
+    Fetchable canonical form of an article URL
+
+    Follows the page's rel=canonical link when one is given (relative links are
+    resolved against url), lowercases the host, drops default ports and fragments,
+    strips tracking parameters and turns AMP variants
+    (amp. hosts, /amp paths, .amp.html, ?amp / ?outputType=amp) into the regular page.
+    """
+    if canonical_link and canonical_link.strip():
+        candidate = urljoin(url, canonical_link.strip())
+        if urlsplit(candidate).scheme in ('http', 'https'):
+            url = candidate
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    host = (parts.hostname or '').lower()
+    if host.startswith('amp.'):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    kept = [(name, value) for name, value in params
+            if not _is_tracking_param(name) and name.lower() not in AMP_PARAMS]
+    # Leave an untouched query string exactly as the publisher wrote it
+    query = parts.query if len(kept) == len(params) else urlencode(kept)
+
+    return urlunsplit((scheme, host, _strip_amp_path(parts.path), query, ''))
+
+
+def dedup_key(url: str, canonical_link: Optional[str] = None) -> str:
+    """Key under which two links to the same article compare equal"""
+    return normalize_url(canonicalize_url(url, canonical_link))